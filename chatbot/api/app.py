@@ -14,6 +14,7 @@ from pydantic import BaseModel
 from chatbot.utils.config import ensure_directories, settings
 from chatbot.utils.utils import setup_logging
 from chatbot.utils.session_manager import get_session_manager
+from chatbot.core.tools import get_tool_latency_snapshot
 
 # Import modular routes
 from chatbot.api.routes import (
@@ -74,6 +75,12 @@ async def health_check():
     )
 
 
+@app.get("/metrics/tools")
+async def tool_latency_metrics():
+    """Per-tool call latency histograms (log2 microsecond buckets)"""
+    return get_tool_latency_snapshot()
+
+
 # Serve web UI
 WEB_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "web")
 
@@ -151,10 +151,8 @@ async def chat(request: ChatRequest):
             current_stage=agent.session_state.current_stage.value,
             timestamp=datetime.utcnow().isoformat(),
         )
-    except Exception as e:
-        logger.error(f"Error processing chat message: {e}")
-        import traceback
-        logger.error(f"Traceback: {traceback.format_exc()}")
+    except Exception:
+        logger.exception("Error processing chat message")
         return ChatResponse(
             session_id=request.session_id,
             responses=[
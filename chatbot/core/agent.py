@@ -2,7 +2,7 @@
 Agentic RAG System
 LangChain-based agent that reasons, uses tools, and queries knowledge base
 """
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from langchain.agents import AgentExecutor, create_openai_functions_agent
 from langchain.memory import ConversationBufferMemory
 from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
@@ -22,7 +22,6 @@ from chatbot.state.states import (
     EngagementState,
     QualificationState,
     SessionState,
-    VerificationState,
 )
 from chatbot.utils.config import settings
 from chatbot.utils.job_fetcher import format_job_details
@@ -111,7 +110,8 @@ class CleoRAGAgent:
             logger.info(f"Added job_id {self.job_id} to agent memory")
         
         # Get tools from the toolkit (bound to this agent's session state)
-        self.tools = self.toolkit.get_tools()
+        self.tools_stage = self.session_state.current_stage if settings.STAGE_TOOL_PROFILES else None
+        self.tools = self.toolkit.get_tools(self.tools_stage)
         self.agent = self._create_agent()
         
         # Track the last stage added to context to avoid repetition
@@ -168,6 +168,16 @@ class CleoRAGAgent:
             job_context=job_context,
             generated_questions=generated_questions,
         )
+
+    def _refresh_tools_for_stage(self):
+        """Rebuild the agent with the current stage's tool profile when the stage has changed"""
+        if not settings.STAGE_TOOL_PROFILES or self.session_state.current_stage == self.tools_stage:
+            return
+        self.tools_stage = self.session_state.current_stage
+        self.tools = self.toolkit.get_tools(self.tools_stage)
+        self.agent = self._create_agent()
+        logger.info("Agent tools switched to {} profile ({} tools)", self.tools_stage, len(self.tools))
+
     def _refresh_agent_with_job_context(self):
         """Refresh the agent with updated job context"""
         self.agent = self._create_agent()
@@ -198,11 +208,15 @@ class CleoRAGAgent:
         else:
             logger.warning(f"Failed to update Xano session {xano_session_id} status")
     
-    def sync_session_state_to_xano(self):
+    def sync_session_state_to_xano(self, extra_fields: Optional[Dict[str, Any]] = None):
         """
         Synchronize the current session state to Xano.
         This ensures Xano always has the most up-to-date status.
         Call this after any state changes to keep Xano in sync.
+        
+        Args:
+            extra_fields: Additional session fields to write in the same request.
+                The synced status/stage fields take precedence over these.
         """
         if not self.session_state.engagement or not self.session_state.engagement.xano_session_id:
             logger.warning("Cannot sync to Xano: No Xano session ID found")
@@ -224,6 +238,7 @@ class CleoRAGAgent:
         
         # Prepare update data with both status and stage information
         update_data = {
+            **(extra_fields or {}),
             "Status": status,
             "conversation_stage": current_stage.value,  # Store the actual stage name
         }
@@ -287,6 +302,7 @@ class CleoRAGAgent:
             "current_stage": self.session_state.current_stage.value,
             "user_message": user_message,
         }
+        self._refresh_tools_for_stage()
         return self._process_message_with_retry(user_message, trace_metadata)
     def _process_message_with_retry(self, user_message: str, trace_metadata: dict, max_retries: int = 3) -> List[str]:
         """
@@ -334,10 +350,8 @@ class CleoRAGAgent:
                     else:
                         # Final attempt failed, use fallback
                         break
-            except Exception as e:
-                logger.error(f"Error on attempt {attempt + 1}: {e}")
-                import traceback
-                logger.error(f"Traceback on attempt {attempt + 1}: {traceback.format_exc()}")
+            except Exception:
+                logger.exception("Error on attempt {}", attempt + 1)
                 if attempt < max_retries - 1:
                     continue
                 else:
@@ -1128,10 +1142,7 @@ WHY THIS MATTERS: The information you collect here will be used to:
             #             )
         # Verification stage updates
         elif self.session_state.current_stage == ConversationStage.VERIFICATION:
-            if not self.session_state.verification:
-                self.session_state.verification = VerificationState(
-                    session_id=self.session_state.session_id
-                )
+            self.toolkit._ensure_verification_state()
             # Handle verification completion
             # This would be triggered by actual verification processes
         # Log state changes and sync to Xano
@@ -1367,10 +1378,8 @@ WHY THIS MATTERS: The information you collect here will be used to:
                 logger.warning("Failed to create candidate during application completion")
                 return None
                 
-        except Exception as e:
-            logger.error(f"Error creating candidate immediately: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error creating candidate immediately")
             return None
 
     def get_conversation_summary(self) -> Dict[str, Any]:
@@ -3,18 +3,37 @@ Agent Tools Module
 Contains tool factory for creating tools bound to an agent instance.
 Uses LangChain's StructuredTool with closure to avoid global state.
 """
+import functools
+import hmac
+import json
 import os
 import re
-import uuid
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
 import requests
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Deque, Dict, List, Optional, Tuple
 from langchain.tools import StructuredTool
 
-from chatbot.state.states import ConversationStage
-from chatbot.utils.utils import setup_logging
+try:
+    from email_validator import EmailNotValidError, validate_email
+    EMAIL_VALIDATOR_AVAILABLE = True
+except ImportError:
+    EMAIL_VALIDATOR_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from chatbot.state.states import ApplicationState, ConversationStage, QualificationState, VerificationState
+from chatbot.utils.utils import get_current_timestamp, setup_logging
 from chatbot.utils.config import settings
 from langchain_openai import ChatOpenAI
-from chatbot.utils.xano_client import get_xano_client
+from chatbot.utils.xano_client import XANO_VERIFICATION_API_URL, get_xano_client
 from chatbot.utils.report_generator import ReportGenerator
 
 if TYPE_CHECKING:
@@ -24,12 +43,223 @@ if TYPE_CHECKING:
 
 logger = setup_logging()
 
+# Tool name -> Counter of call latencies keyed by bucket; bucket b holds calls that took < 2**b microseconds
+TOOL_LATENCY: Dict[str, Counter] = defaultdict(Counter)
+_TOOL_LATENCY_LOCK = threading.Lock()
+
+
+def _record_latency(name: str, started_ns: int) -> None:
+    bucket = ((time.perf_counter_ns() - started_ns) // 1000).bit_length()
+    with _TOOL_LATENCY_LOCK:
+        TOOL_LATENCY[name][bucket] += 1
+
+
+def _timed(fn):
+    """Record each call's wall-clock latency in TOOL_LATENCY under the function's name"""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        started_ns = time.perf_counter_ns()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _record_latency(fn.__name__, started_ns)
+    return wrapper
+
+
+def get_tool_latency_snapshot() -> Dict[str, Dict[str, int]]:
+    """Copy of TOOL_LATENCY with readable bucket labels (upper bound in microseconds)"""
+    with _TOOL_LATENCY_LOCK:
+        return {
+            name: {f"<{2 ** bucket}us": count for bucket, count in sorted(buckets.items())}
+            for name, buckets in TOOL_LATENCY.items()
+        }
+
+# Precompiled validation patterns
+# Length-bounded parts (RFC 5321 local/domain limits) cap backtracking on hostile input
+EMAIL_RE = re.compile(r"\A[A-Za-z0-9._%+\-]{1,64}@[A-Za-z0-9][A-Za-z0-9.\-]{0,253}\.[A-Za-z]{2,24}\Z")
+# Seven or more digits, allowing the usual phone separators between them
+PHONE_HINT_RE = re.compile(r"\d(?:[\s().+\-]*\d){6}")
+# Canonical 8-4-4-4-12 hex UUID, the only form Xano issues
+UUID_RE = re.compile(r"\A[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z")
+
+
+class _DigitsOnlyTable(dict):
+    """str.translate table that keeps digits and deletes every other character (filled lazily)"""
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        keep = codepoint if chr(codepoint).isdigit() else None
+        self[codepoint] = keep
+        return keep
+
+
+DIGITS_ONLY = _DigitsOnlyTable()
+
+
+def normalize_email(email: Optional[str]) -> Optional[str]:
+    """
+    Validate an email address and return its cleaned (stripped, lowercased) form.
+    Uses email-validator when installed, otherwise EMAIL_RE.
+    
+    Returns:
+        The normalized email, or None if it is not a valid address
+    """
+    if not email:
+        return None
+    email = email.strip()
+    # Cheap structural reject before running the full validator
+    local, at, domain = email.rpartition("@")
+    if not at or not local or "@" in local or "." not in domain:
+        return None
+    if EMAIL_VALIDATOR_AVAILABLE:
+        try:
+            email = validate_email(email, check_deliverability=False).normalized
+        except EmailNotValidError:
+            return None
+    elif not EMAIL_RE.match(email):
+        return None
+    return email.lower()
+
+
+def normalize_phone(phone: Optional[str]) -> Optional[str]:
+    """
+    Reduce a phone number to its digits, keeping a leading + if present.
+    
+    Returns:
+        The cleaned number, or None if it contains no digits
+    """
+    if not phone:
+        return None
+    stripped = str(phone).strip()
+    digits = stripped.translate(DIGITS_ONLY)
+    if not digits:
+        return None
+    return "+" + digits if stripped[:1] == "+" else digits
+
+
+# Runs of letters in a name; apostrophes, hyphens and spaces separate the parts
+NAME_PART_RE = re.compile(r"[^\W\d_]+")
+
+
+def _capitalize_name_part(match: "re.Match") -> str:
+    """Capitalize one name part, keeping mixed case that starts with a capital (McDonald, DeShawn)"""
+    part = match.group(0)
+    if part[0].isupper() and not part.isupper():
+        return part
+    return part.capitalize()
+
+
+def _json_dumps(payload: dict) -> bytes:
+    """Encode a request body (orjson when installed)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def _json_loads(body: bytes):
+    """Decode a response body (orjson when installed); raises ValueError on malformed JSON"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Tools offered to the LLM at each stage when settings.STAGE_TOOL_PROFILES is on (None = every tool).
+# Leaving out the verification tools' long descriptions before they are needed shrinks each prompt.
+_COLLECT_TOOLS = (
+    "save_state",
+    "save_name",
+    "save_email",
+    "save_phone_number",
+    "save_age",
+    "mark_experience_collected",
+    "create_candidate_early",
+    "conclude_session",
+)
+TOOL_PROFILES: Dict[str, Optional[Tuple[str, ...]]] = {
+    ConversationStage.ENGAGEMENT.value: _COLLECT_TOOLS,
+    ConversationStage.QUALIFICATION.value: _COLLECT_TOOLS,
+    ConversationStage.APPLICATION.value: _COLLECT_TOOLS + (
+        "update_candidate_email",
+        "update_candidate_phone",
+        "send_email_verification_code",
+        "send_phone_verification_code",
+        "send_both_verification_codes",
+        "patch_candidate_with_report",
+    ),
+    ConversationStage.VERIFICATION.value: None,
+    # A verified phone moves the session to COMPLETED, so the email may still need verifying here
+    ConversationStage.COMPLETED.value: (
+        "save_state",
+        "update_candidate_email",
+        "update_candidate_phone",
+        "send_email_verification_code",
+        "validate_email_verification",
+        "send_phone_verification_code",
+        "validate_phone_verification",
+        "send_both_verification_codes",
+        "patch_candidate_with_report",
+        "conclude_session",
+    ),
+}
+
+# Xano verification endpoints
+SEND_EMAIL_CODE_URL = f"{XANO_VERIFICATION_API_URL}/Send_Code_to_Email"
+VALIDATE_EMAIL_URL = f"{XANO_VERIFICATION_API_URL}/ValidateEmail"
+SEND_PHONE_CODE_URL = f"{XANO_VERIFICATION_API_URL}/Send_Code_to_Phone"
+VALIDATE_PHONE_URL = f"{XANO_VERIFICATION_API_URL}/ValidatePhoneVerification"
+
 
 class AgentToolkit:
     """
     Toolkit that creates tools bound to a specific agent's session state.
     This avoids using global variables by encapsulating state within the toolkit instance.
     """
+    # One toolkit lives per chat session; fixed slots keep instances small and lookups fast
+    __slots__ = (
+        "session_state",
+        "job_id",
+        "agent",
+        "xano_client",
+        "_session",
+        "_session_concluded",
+        "_candidate_created",
+        "_candidate_id",
+        "_tools",
+        "_stage_tools",
+        "_state_version",
+        "_report_task",
+        "_report_memo",
+        "_validation_cache",
+        "_send_code_log",
+        "_report_generator_inst",
+        "_last_contact_sync",
+        "_contact_sync_task",
+        "_contact_sync_dirty",
+        "_contact_sync_lock",
+    )
+
+    # Seconds a successful code validation is remembered (failures are never cached)
+    VALIDATION_CACHE_TTL = 300
+    # At most SEND_CODE_LIMIT verification codes per email/phone within SEND_CODE_WINDOW seconds
+    SEND_CODE_LIMIT = 5
+    SEND_CODE_WINDOW = 3600
+    # (label, ApplicationState attribute) for the contact details a candidate record needs
+    _REQUIRED_CONTACT = (("name", "full_name"), ("email", "email"), ("phone", "phone_number"))
+    # (ApplicationState attribute, Xano session field) for the contact details mirrored to the session
+    _XANO_CONTACT_FIELDS = (
+        ("full_name", "candidate_name"),
+        ("email", "candidate_email"),
+        ("phone_number", "candidate_phone"),
+        ("age", "candidate_age"),
+    )
+    # Tool name -> inferred pydantic args schema, shared by every toolkit (see _make_tool)
+    _args_schemas: Dict[str, type] = {}
+    # Shared worker pool for report generation so it can overlap with Xano I/O
+    _report_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cleo-report")
+    # Small pool for short Xano calls: the side-by-side sends of send_both_verification_codes,
+    # the background contact syncs of the save_* tools, job prefetches and Xano contact restores
+    _send_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cleo-verify")
     
     def __init__(self, session_state: "SessionState", job_id: Optional[str] = None, agent: Optional["CleoRAGAgent"] = None):
         """
@@ -46,17 +276,31 @@ class AgentToolkit:
         self.xano_client = get_xano_client()
         self._session_concluded = False  # Track if session has been concluded
         self._candidate_created = False  # Track if candidate has been created
-        self._report_generator = ReportGenerator(xano_client=self.xano_client)
-        logger.info(f"AgentToolkit initialized for session {session_state.session_id}, job_id: {job_id}")
+        self._candidate_id: Optional[int] = None  # Memoized Xano candidate ID once known
+        self._session = self.xano_client.session  # Reuse the Xano client's keep-alive pool
+        self._tools: Optional[List[StructuredTool]] = None  # Built once by get_tools()
+        self._stage_tools: Dict[str, List[StructuredTool]] = {}  # stage value -> filtered tool list
+        self._state_version = 0  # Bumped whenever a tool mutates candidate data
+        self._report_task = None  # Background report/patch job (conclude_session, patch_candidate_with_report)
+        self._report_memo: Optional[Tuple[tuple, Tuple[Optional[str], float, str]]] = None  # (key, report result)
+        self._validation_cache: Dict[Tuple[str, Optional[int], str], float] = {}  # (kind, user_id, code) -> validated at
+        self._send_code_log: Dict[Tuple[str, str], Deque[float]] = {}  # (kind, normalized identifier) -> recent send times
+        self._report_generator_inst: Optional[ReportGenerator] = None  # Built on first report (see _report_generator)
+        self._last_contact_sync: Optional[dict] = None  # Contact fields last written by _sync_application_data_to_xano
+        self._contact_sync_task: Optional[Future] = None  # Latest background contact sync (see _schedule_contact_sync)
+        self._contact_sync_dirty = False  # A save landed while that sync was running; sync again when it ends
+        self._contact_sync_lock = threading.RLock()
+        logger.info("AgentToolkit initialized for session {}, job_id: {}", session_state.session_id, job_id)
         # Ensure Application state exists so candidate contact details can be stored reliably
-        try:
-            from chatbot.state.states import ApplicationState
-            if not self.session_state.application:
-                self.session_state.application = ApplicationState(session_id=self.session_state.session_id)
-        except Exception:
-            # If import fails for any reason, don't block toolkit initialization
-            logger.debug("Could not auto-initialize ApplicationState in toolkit init")
+        self._ensure_application_state()
     
+    @property
+    def _report_generator(self) -> ReportGenerator:
+        """Report generator, created on first use so sessions that never conclude don't pay for it"""
+        if self._report_generator_inst is None:
+            self._report_generator_inst = ReportGenerator(xano_client=self.xano_client)
+        return self._report_generator_inst
+
     def _is_valid_uuid(self, value: str) -> bool:
         """
         Check if a string is a valid UUID.
@@ -67,12 +311,19 @@ class AgentToolkit:
         Returns:
             True if valid UUID, False otherwise
         """
-        try:
-            uuid.UUID(str(value))
-            return True
-        except (ValueError, AttributeError):
-            return False
+        return bool(UUID_RE.match(str(value)))
     
+    def _prefetch_job(self) -> None:
+        """Warm the Xano client's job cache for the session's job so candidate creation doesn't wait on it"""
+        job_id = self.job_id or (self.session_state.engagement.job_id if self.session_state.engagement else None)
+        if not job_id:
+            return
+        try:
+            self.xano_client.get_job_by_id(job_id)
+        except Exception as e:
+            # Candidate creation retries the lookup and reports any failure itself
+            logger.debug("Job prefetch for {} failed: {}", job_id, e)
+
     def save_state(self, milestone: str) -> str:
         """
         Save the current conversation state to persistent storage.
@@ -80,16 +331,37 @@ class AgentToolkit:
         Args:
             milestone: Description of the milestone being saved
         """
-        logger.info(f"State milestone saved: {milestone} for session {self.session_state.session_id}")
+        logger.info("State milestone saved: {} for session {}", milestone, self.session_state.session_id)
         return f"State tracked in memory for session {self.session_state.session_id}: {milestone}"
     
+    def _bump_state_version(self) -> None:
+        """Invalidate memoized results derived from candidate data"""
+        self._state_version += 1
+
+    def _report_memo_key(self) -> tuple:
+        """Key identifying the inputs of the current report (candidate data + conversation length)"""
+        message_count = None
+        if self.agent:
+            message_count = len(self.agent.memory.chat_memory.messages)
+        return (self._state_version, message_count)
+
     def _generate_report_and_extract_data(self) -> tuple[Optional[str], float, str]:
         """
         Generate PDF report and extract fit_score and profile_summary.
+        The result is reused while neither the candidate data nor the conversation has changed.
         
         Returns:
             Tuple of (pdf_path, fit_score, profile_summary)
         """
+        memo_key = self._report_memo_key()
+        if self._report_memo and self._report_memo[0] == memo_key:
+            pdf_path, fit_score, profile_summary = self._report_memo[1]
+            logger.info("Reusing report generated for unchanged session data (fit_score: {})", fit_score)
+            # The PDF is deleted once uploaded; don't hand out a stale path
+            if pdf_path and not os.path.exists(pdf_path):
+                pdf_path = None
+            return pdf_path, fit_score, profile_summary
+
         try:
             session_id = self.session_state.session_id
             xano_session_id = None
@@ -100,7 +372,7 @@ class AgentToolkit:
             
             # If we have a Xano session ID, use it to generate the report
             if xano_session_id:
-                logger.info(f"Generating report for Xano session {xano_session_id}")
+                logger.info("Generating report for Xano session {}", xano_session_id)
                 
                 result = self._report_generator.generate_report(
                     session_id=str(xano_session_id)
@@ -108,22 +380,27 @@ class AgentToolkit:
                 
                 pdf_path = result.get('pdf_report')
                 fit_score = result.get('fit_score', 0)
-                profile_summary = result.get('profile_summary', '')
+                # Callers send the summary to Xano as-is, so settle its type here once
+                profile_summary = result.get('profile_summary') or ''
+                if not isinstance(profile_summary, str):
+                    profile_summary = json.dumps(profile_summary)
                 
-                logger.info(f"Generated PDF report for Xano session {xano_session_id}: {pdf_path}")
-                logger.info(f"Extracted fit_score: {fit_score}, profile_summary length: {len(profile_summary)}")
+                logger.info("Generated PDF report for Xano session {}: {}", xano_session_id, pdf_path)
+                logger.opt(lazy=True).info(
+                    "Extracted fit_score: {}, profile_summary length: {}",
+                    lambda: fit_score, lambda: len(profile_summary),
+                )
+                self._report_memo = (memo_key, (pdf_path, fit_score, profile_summary))
                 return pdf_path, fit_score, profile_summary
             else:
-                logger.warning(f"No Xano session ID available for session {session_id}, cannot generate report")
+                logger.warning("No Xano session ID available for session {}, cannot generate report", session_id)
                 return None, 0, ''
                 
-        except Exception as e:
-            logger.error(f"Error generating report: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error generating report")
             return None, 0, ''
     
-    def _create_candidate_on_conclude(self, fit_score: float, profile_summary: str, pdf_path: Optional[str]) -> Optional[int]:
+    def _create_candidate_on_conclude(self, fit_score: float, profile_summary: str, pdf_path: Optional[str], link_session: bool = True) -> Optional[int]:
         """
         Create candidate record when session concludes.
         This is called only once when the session ends.
@@ -132,6 +409,8 @@ class AgentToolkit:
             fit_score: Fit score value from report generation
             profile_summary: Profile summary/explanation from report generation
             pdf_path: Path to generated PDF report
+            link_session: Write the new candidate_id to the Xano session. Callers that
+                send their own session update including candidate_id pass False.
             
         Returns:
             Candidate ID if created, None otherwise
@@ -142,53 +421,27 @@ class AgentToolkit:
                 logger.info("Candidate already created for this session")
                 if self.session_state.engagement and self.session_state.engagement.candidate_id:
                     return self.session_state.engagement.candidate_id
-                return None
+                return self._candidate_id
             
-            # Get candidate name from application state
-            name = None
-            email = None
-            phone = None
+            # Verify required candidate contact information is present before cleaning any of it
+            missing = self._missing_contact_fields()
+            if missing:
+                logger.warning("Cannot create candidate: no {} available", ", ".join(missing))
+                return None
             
-            if self.session_state.application:
-                name = self.session_state.application.full_name
-                email = self.session_state.application.email
-                phone = self.session_state.application.phone_number
+            # Get candidate contact details from application state
+            app = self.session_state.application
+            name, email, phone = app.full_name, app.email, app.phone_number
 
             # Validate and sanitize email
             email_clean = None
             if email:
-                # Validate email format using regex
-                email_pattern = r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}$"
-                if re.match(email_pattern, email.strip()):
-                    email_clean = email.strip().lower()
-                else:
-                    logger.warning(f"Invalid email format: {email}. Skipping email field.")
+                email_clean = normalize_email(email)
+                if not email_clean:
+                    logger.warning("Invalid email format: {}. Skipping email field.", email)
 
             # Sanitize phone: preserve + sign if present, extract digits
-            phone_clean = None
-            if phone:
-                try:
-                    stripped = str(phone).strip()
-                    # Check if phone starts with +
-                    has_plus = stripped.startswith('+')
-                    # Extract digits only (strip -, spaces, parentheses, etc.)
-                    digits = ''.join(filter(str.isdigit, stripped))
-                    if digits:
-                        # Add + sign back if it was present
-                        phone_clean = f"+{digits}" if has_plus else digits
-                except Exception:
-                    phone_clean = None
-            
-            # Verify required candidate contact information is present
-            if not name:
-                logger.warning("Cannot create candidate: no name available")
-                return None
-            if not email:
-                logger.warning("Cannot create candidate: no email available")
-                return None
-            if not phone:
-                logger.warning("Cannot create candidate: no phone available")
-                return None
+            phone_clean = normalize_phone(phone)
             
             # Get job_id and company_id
             job_id = self.job_id
@@ -204,36 +457,34 @@ class AgentToolkit:
             # Validate job_id is a UUID, if not try to fetch from Xano
             if job_id:
                 if not self._is_valid_uuid(job_id):
-                    logger.warning(f"job_id '{job_id}' is not a valid UUID. Attempting to fetch job from Xano...")
+                    logger.warning("job_id '{}' is not a valid UUID. Attempting to fetch job from Xano...", job_id)
                     job_data = self.xano_client.get_job_by_id(job_id)
                     if job_data and 'id' in job_data:
                         job_id = str(job_data['id'])
-                        logger.info(f"Retrieved UUID job_id from Xano: {job_id}")
+                        logger.info("Retrieved UUID job_id from Xano: {}", job_id)
                         # Also extract company_id if not already set
                         if not company_id and 'company_id' in job_data:
                             company_id = job_data['company_id']
-                            logger.info(f"Retrieved company_id from job data: {company_id}")
+                            logger.info("Retrieved company_id from job data: {}", company_id)
                     else:
-                        logger.error(f"Failed to retrieve job with ID '{job_id}' from Xano. Cannot create candidate without valid UUID.")
+                        logger.error("Failed to retrieve job with ID '{}' from Xano. Cannot create candidate without valid UUID.", job_id)
                         return None
             else:
                 logger.warning("No job_id available for candidate creation")
             
             # If company_id is still None, fetch job details to get company_id
             if not company_id and job_id:
-                logger.info(f"company_id not set, fetching job details for job_id: {job_id}")
+                logger.info("company_id not set, fetching job details for job_id: {}", job_id)
                 job_data = self.xano_client.get_job_by_id(job_id)
                 if job_data and '_related_company' in job_data:
                     company_id = job_data['_related_company']['id']
-                    logger.info(f"Retrieved company_id from job data: {company_id}")
+                    logger.info("Retrieved company_id from job data: {}", company_id)
                 else:
-                    logger.warning(f"Failed to retrieve company_id from job {job_id}")
+                    logger.warning("Failed to retrieve company_id from job {}", job_id)
             
-            logger.info(f"Creating candidate {name} with score {fit_score}")
+            logger.info("Creating candidate {} with score {}", name, fit_score)
             
             # Create candidate in Xano with fit score and PDF
-            # Ensure profile_summary is a string (should already be JSON string from report generator)
-            profile_summary_str = profile_summary if isinstance(profile_summary, str) else str(profile_summary)
             
             candidate = self.xano_client.create_candidate(
                 name=name or "unable to fetch",
@@ -245,17 +496,17 @@ class AgentToolkit:
                 company_id=company_id,
                 session_id=xano_session_id,
                 status="Short Listed",
-                profilesummary=profile_summary_str
+                profilesummary=profile_summary
             )
 
-            logger.info("========================================")
-            logger.info(f"Candidate creation response: {candidate}")
-            logger.info("========================================")
+            # Full response dump is debug detail; loguru only formats it when DEBUG is enabled
+            logger.debug("Candidate creation response: {}", candidate)
             
             if candidate:
                 candidate_id = candidate.get('id')
                 user_id = candidate.get('user_id')  # Extract user_id from candidate response
                 self._candidate_created = True
+                self._candidate_id = candidate_id
 
                 
                 # Store candidate_id and user_id in engagement state
@@ -263,20 +514,20 @@ class AgentToolkit:
                     self.session_state.engagement.candidate_id = candidate_id
                     if user_id:
                         self.session_state.engagement.user_id = user_id
-                        logger.info(f"Saved user_id {user_id} for candidate {candidate_id}")
+                        logger.info("Saved user_id {} for candidate {}", user_id, candidate_id)
                     # Update session with candidate_id in Xano
-                    if xano_session_id:
+                    if xano_session_id and link_session:
                         self.xano_client.update_session(xano_session_id, {"candidate_id": candidate_id})
                 
-                logger.info(f"Created candidate {candidate_id} for session {self.session_state.session_id} with score {fit_score:.2f}")
+                logger.info("Created candidate {} for session {} with score {:.2f}", candidate_id, self.session_state.session_id, fit_score)
                 
                 # Delete the local PDF report after successful candidate creation
-                if pdf_path and os.path.exists(pdf_path):
+                if pdf_path:
                     try:
-                        os.remove(pdf_path)
-                        logger.info(f"Deleted local PDF report: {pdf_path}")
-                    except Exception as e:
-                        logger.warning(f"Failed to delete local PDF report {pdf_path}: {e}")
+                        Path(pdf_path).unlink(missing_ok=True)
+                        logger.info("Deleted local PDF report: {}", pdf_path)
+                    except OSError as e:
+                        logger.warning("Failed to delete local PDF report {}: {}", pdf_path, e)
                 
                 
                 return candidate_id
@@ -284,7 +535,7 @@ class AgentToolkit:
                 logger.warning("Failed to create candidate in Xano")
                 return None
         except Exception as e:
-            logger.error(f"Error creating candidate: {e}")
+            logger.error("Error creating candidate: {}", e)
             return None
 
     def _fetch_contact_info_from_memory(self) -> bool:
@@ -297,39 +548,43 @@ class AgentToolkit:
         Returns:
             True if all contact fields are present, False otherwise
         """
-        try:
-            from chatbot.state.states import ApplicationState
-            
-            # Ensure application state exists
-            if not self.session_state.application:
-                self.session_state.application = ApplicationState(session_id=self.session_state.session_id)
-            
-            app = self.session_state.application
-            
-            # Check if all required contact fields are present
-            has_all_info = (
-                app.full_name is not None and
-                app.email is not None and
-                app.phone_number is not None
-            )
-            
-            if has_all_info:
-                logger.info("All contact information is present in application state")
-            else:
-                missing = []
-                if not app.full_name:
-                    missing.append("full_name")
-                if not app.email:
-                    missing.append("email")
-                if not app.phone_number:
-                    missing.append("phone_number")
-                logger.warning(f"Missing contact information: {', '.join(missing)}")
-            
-            return has_all_info
-            
-        except Exception as e:
-            logger.error(f"Error checking contact info: {e}")
+        app = self._ensure_application_state()
+        
+        # Check if all required contact fields are present
+        if app.full_name and app.email and app.phone_number:
+            logger.info("All contact information is present in application state")
+            return True
+        
+        logger.warning("Missing contact information: {}", ', '.join(self._missing_contact_fields()))
+        return False
+
+    def _history_may_hold_contact(self, missing: List[str]) -> bool:
+        """
+        Cheap check that the chat history could still supply a missing contact field.
+        
+        False when the candidate's messages hold no '@' for a missing email and no digit
+        run for a missing phone.
+        """
+        messages = self.agent.memory.chat_memory.messages
+        text = " ".join(str(m.content) for m in messages if getattr(m, "type", None) == "human")
+        if not text.strip():
             return False
+        return (
+            "name" in missing
+            or ("email" in missing and "@" in text)
+            or ("phone" in missing and PHONE_HINT_RE.search(text) is not None)
+        )
+
+    def _can_create_candidate(self) -> bool:
+        """True when no candidate was created yet and name, email and phone are all present"""
+        return not self._candidate_created and not self._missing_contact_fields()
+
+    def _missing_contact_fields(self) -> List[str]:
+        """Labels of the required contact fields not yet present in the application state"""
+        app = self.session_state.application
+        if not app:
+            return [label for label, _ in self._REQUIRED_CONTACT]
+        return [label for label, attr in self._REQUIRED_CONTACT if not getattr(app, attr)]
 
     def _sync_application_data_to_xano(self) -> bool:
         """
@@ -353,33 +608,145 @@ class AgentToolkit:
             
             # Prepare update data with application fields
             update_data = {}
-            
-            if app.full_name:
-                update_data["candidate_name"] = app.full_name
-            if app.email:
-                update_data["candidate_email"] = app.email
-            if app.phone_number:
-                update_data["candidate_phone"] = app.phone_number
-            if app.age:
-                update_data["candidate_age"] = app.age
+            for attr, xano_key in self._XANO_CONTACT_FIELDS:
+                value = getattr(app, attr)
+                if value:
+                    update_data[xano_key] = value
+            
+            # Re-saving a value the session already holds (e.g. a re-confirmed email) needs no write
+            if update_data and update_data == self._last_contact_sync:
+                logger.debug("Application data unchanged since last sync to Xano session {}", xano_session_id)
+                return True
             
             # Only update if we have data to sync
             if update_data:
                 result = self.xano_client.update_session(xano_session_id, update_data)
                 if result:
-                    logger.info(f"Synced application data to Xano session {xano_session_id}: {list(update_data.keys())}")
+                    self._last_contact_sync = update_data
+                    logger.info("Synced application data to Xano session {}: {}", xano_session_id, list(update_data.keys()))
                     return True
                 else:
-                    logger.warning(f"Failed to sync application data to Xano session {xano_session_id}")
+                    logger.warning("Failed to sync application data to Xano session {}", xano_session_id)
                     return False
             else:
                 logger.debug("No application data to sync to Xano")
                 return True
                 
         except Exception as e:
-            logger.error(f"Error syncing application data to Xano: {e}")
+            logger.error("Error syncing application data to Xano: {}", e)
             return False
 
+    def _schedule_contact_sync(self) -> None:
+        """
+        Sync application data to Xano in the background so the save_* tools reply without a round trip.
+        
+        Saves made while a sync is still queued share it, since it reads the application state
+        only when it starts. A save made while one is running marks the data dirty, and the
+        running sync's done-callback submits the follow-up, so writes land in order without a
+        pool worker ever waiting on another.
+        """
+        with self._contact_sync_lock:
+            task = self._contact_sync_task
+            if task is None or task.done():
+                self._submit_contact_sync()
+            elif task.running():
+                self._contact_sync_dirty = True
+
+    def _submit_contact_sync(self) -> None:
+        """Submit one contact sync to the send pool (caller holds _contact_sync_lock)"""
+        self._contact_sync_dirty = False
+        self._contact_sync_task = self._send_pool.submit(self._sync_application_data_to_xano)
+        self._contact_sync_task.add_done_callback(self._on_contact_sync_done)
+
+    def _on_contact_sync_done(self, task: Future) -> None:
+        """Run the follow-up sync for saves made while this one was running"""
+        with self._contact_sync_lock:
+            if task is self._contact_sync_task and self._contact_sync_dirty:
+                self._submit_contact_sync()
+
+    def _drain_contact_sync(self) -> None:
+        """Wait until no background contact sync is pending or due"""
+        while True:
+            with self._contact_sync_lock:
+                task = self._contact_sync_task
+                if task is None or (task.done() and not self._contact_sync_dirty):
+                    return
+                # Finished but its follow-up isn't submitted yet: run the follow-up here instead
+                run_now = task.done()
+                if run_now:
+                    self._contact_sync_dirty = False
+            if run_now:
+                self._sync_application_data_to_xano()
+                return
+            wait([task])
+
+    def _report_patch_pending(self) -> bool:
+        """True while a background report patch (see _report_task) has not finished"""
+        return self._report_task is not None and not self._report_task.done()
+
+    def _patch_candidate_on_conclude(self, candidate_id: int) -> None:
+        """
+        Generate the final report and patch an existing candidate with it.
+        Runs on the report pool so conclude_session can reply without waiting for it.
+        
+        Args:
+            candidate_id: ID of the candidate created earlier in the session
+        """
+        pdf_path, fit_score, profile_summary = self._generate_report_and_extract_data()
+        if pdf_path:
+            logger.info("Session conclude - PDF report generated: {}", pdf_path)
+        logger.info("Session conclude - Fit score extracted: {:.2f}", fit_score)
+        self._patch_candidate_report(candidate_id, pdf_path, fit_score, profile_summary)
+
+    def _patch_candidate_report(self, candidate_id: int, pdf_path: Optional[str], fit_score: float, profile_summary: str) -> None:
+        """
+        Patch an existing candidate with a generated report, uploading the PDF.
+        The local PDF is deleted once the patch succeeds.
+        
+        Args:
+            candidate_id: ID of the candidate to patch
+            pdf_path: Path to the report PDF, if one was generated
+            fit_score: Fit score extracted from the report
+            profile_summary: Profile summary extracted from the report
+        """
+        try:
+            result = self.xano_client.patch_candidate_complete(
+                candidate_id=candidate_id,
+                score=fit_score,
+                profile_summary=profile_summary,
+                status="Short Listed",
+                report_pdf=pdf_path,
+                session_id=self.session_state.engagement.xano_session_id if self.session_state.engagement else None
+            )
+            
+            if result:
+                logger.info("Successfully patched candidate {} with report data (score: {:.2f})", candidate_id, fit_score)
+                if pdf_path:
+                    try:
+                        Path(pdf_path).unlink(missing_ok=True)
+                        logger.info("Deleted local PDF report: {}", pdf_path)
+                    except OSError as e:
+                        logger.warning("Failed to delete local PDF report {}: {}", pdf_path, e)
+                
+                # Upload PDF if available
+                # if pdf_path and os.path.exists(pdf_path):
+                #     upload_result = self.xano_client.upload_candidate_report_pdf(candidate_id, pdf_path)
+                #     if upload_result:
+                #         logger.info(f"Successfully uploaded PDF report for candidate {candidate_id}")
+                #         # Delete local PDF after successful upload
+                #         try:
+                #             os.remove(pdf_path)
+                #             logger.info(f"Deleted local PDF report: {pdf_path}")
+                #         except Exception as e:
+                #             logger.warning(f"Failed to delete local PDF report {pdf_path}: {e}")
+                #     else:
+                #         logger.warning(f"Failed to upload PDF report for candidate {candidate_id}")
+            else:
+                logger.warning("Failed to patch candidate {} with report data", candidate_id)
+        except Exception as e:
+            logger.error("Error patching candidate {}: {}", candidate_id, e)
+
+    @_timed
     def conclude_session(self, reason: str) -> str:
         """
         Conclude the current session when the user indicates they want to end the conversation
@@ -388,6 +755,7 @@ class AgentToolkit:
         This method:
         1. Generates a PDF report and extracts fit score and profile summary
         2. Creates the candidate record with score, profile summary, and PDF
+           (an existing candidate is patched with the report in the background)
         3. Updates the session status in Xano
         
         Args:
@@ -398,130 +766,75 @@ class AgentToolkit:
                 return "Session has already been concluded."
             
             self._session_concluded = True
+            # Contact details restored from the Xano session below must include the latest saves
+            self._drain_contact_sync()
             xano_session_id = None
             
             if self.session_state.engagement:
                 xano_session_id = self.session_state.engagement.xano_session_id
             
-            # Determine final status based on what was collected
-            final_status = "Ended"
-            if self.session_state.application and self.session_state.application.stage_completed:
-                final_status = "Completed"
-            elif self.session_state.qualification and self.session_state.qualification.stage_completed:
-                final_status = "Qualified - Pending"
-            elif self.session_state.engagement and self.session_state.engagement.consent_given:
-                final_status = "In Progress - Paused"
-            else:
-                final_status = "Ended - Early Exit"
+            # Determine final status based on what was collected (first matching check wins)
+            app = self.session_state.application
+            qual = self.session_state.qualification
+            eng = self.session_state.engagement
+            status_checks = (
+                (app and app.stage_completed, "Completed"),
+                (qual and qual.stage_completed, "Qualified - Pending"),
+                (eng and eng.consent_given, "In Progress - Paused"),
+            )
+            final_status = next((status for cond, status in status_checks if cond), "Ended - Early Exit")
             
-            # Step 1: Generate PDF report and extract fit score and profile summary
-            pdf_path, fit_score, profile_summary = self._generate_report_and_extract_data()
-            if pdf_path:
-                logger.info(f"Session conclude - PDF report generated: {pdf_path}")
-            logger.info(f"Session conclude - Fit score extracted: {fit_score:.2f}")
+            # Without a Xano session there is no report to generate or session to update, and without
+            # contact details no candidate to create, so skip straight to closing the session locally
+            candidate_known = self._candidate_id or (eng and eng.candidate_id)
+            if not xano_session_id and not candidate_known and self._missing_contact_fields():
+                logger.info("No Xano session or contact details; concluding without report or candidate")
+                self._mark_stages_completed()
+                return f"Session concluded successfully. Status: {final_status}. Reason: {reason}"
             
-            # Step 2: Check if candidate already exists, then patch or create
+            # Step 1: Check if candidate was already created earlier (e.g., during verification)
             candidate_id = None
-            
-            # Check if candidate was already created earlier (e.g., during verification)
             if self.session_state.engagement and self.session_state.engagement.candidate_id:
                 candidate_id = self.session_state.engagement.candidate_id
-                logger.info(f"Candidate already exists (ID: {candidate_id}), will patch with report data")
-                
-                # Patch existing candidate with report data
-                try:
-                    # Ensure profile_summary is a string (should already be JSON string from report generator)
-                    profile_summary_str = profile_summary if isinstance(profile_summary, str) else str(profile_summary)
-                    
-                    result = self.xano_client.patch_candidate_complete(
-                        candidate_id=candidate_id,
-                        score=fit_score,
-                        profile_summary=profile_summary_str,
-                        status="Short Listed",
-                        report_pdf=pdf_path,
-                        session_id=self.session_state.engagement.xano_session_id if self.session_state.engagement else None
-                    )
-                    
-                    if result:
-                        logger.info(f"Successfully patched candidate {candidate_id} with report data (score: {fit_score:.2f})")
-                        try:
-                            os.remove(pdf_path)
-                            logger.info(f"Deleted local PDF report: {pdf_path}")
-                        except Exception as e:
-                            logger.warning(f"Failed to delete local PDF report {pdf_path}: {e}")
-                        
-                        # Upload PDF if available
-                        # if pdf_path and os.path.exists(pdf_path):
-                        #     upload_result = self.xano_client.upload_candidate_report_pdf(candidate_id, pdf_path)
-                        #     if upload_result:
-                        #         logger.info(f"Successfully uploaded PDF report for candidate {candidate_id}")
-                        #         # Delete local PDF after successful upload
-                        #         try:
-                        #             os.remove(pdf_path)
-                        #             logger.info(f"Deleted local PDF report: {pdf_path}")
-                        #         except Exception as e:
-                        #             logger.warning(f"Failed to delete local PDF report {pdf_path}: {e}")
-                        #     else:
-                        #         logger.warning(f"Failed to upload PDF report for candidate {candidate_id}")
-                    else:
-                        logger.warning(f"Failed to patch candidate {candidate_id} with report data")
-                except Exception as e:
-                    logger.error(f"Error patching candidate {candidate_id}: {e}")
+                if self._report_patch_pending():
+                    # patch_candidate_with_report is already patching this candidate; a second job would race it
+                    logger.info("Candidate {} is already being patched with its report, reusing that job", candidate_id)
+                else:
+                    logger.info("Candidate already exists (ID: {}), will patch with report data in the background", candidate_id)
+                    # The reply doesn't depend on the report, so render it and patch the candidate off the request path
+                    self._report_task = self._report_pool.submit(self._patch_candidate_on_conclude, candidate_id)
+                self._restore_contact_from_xano()
             else:
                 # No existing candidate, need to create one
                 logger.info("No existing candidate found, will create new candidate if contact info available")
-
-            # First, try to load contact info from Xano session data (in case it was synced earlier)
-            if self.session_state.engagement and self.session_state.engagement.xano_session_id:
-                xano_session_id = self.session_state.engagement.xano_session_id
-                try:
-                    xano_session = self.xano_client.get_session_by_id(xano_session_id)
-                    if xano_session:
-                        # Load contact info from Xano into application state if not already present
-                        from chatbot.state.states import ApplicationState
-                        if not self.session_state.application:
-                            self.session_state.application = ApplicationState(session_id=self.session_state.session_id)
-                        
-                        app = self.session_state.application
-                        
-                        # Restore from Xano if local state is missing
-                        if not app.full_name and xano_session.get("candidate_name"):
-                            app.full_name = xano_session["candidate_name"]
-                            logger.info(f"Restored name from Xano: {app.full_name}")
-                        if not app.email and xano_session.get("candidate_email"):
-                            app.email = xano_session["candidate_email"]
-                            logger.info(f"Restored email from Xano: {app.email}")
-                        if not app.phone_number and xano_session.get("candidate_phone"):
-                            app.phone_number = xano_session["candidate_phone"]
-                            logger.info(f"Restored phone from Xano: {app.phone_number}")
-                        if not app.age and xano_session.get("candidate_age"):
-                            app.age = xano_session["candidate_age"]
-                            logger.info(f"Restored age from Xano: {app.age}")
-                except Exception as e:
-                    logger.debug(f"Could not load session data from Xano: {e}")
+                # Restore contact info and warm the job lookup candidate creation needs on the send pool,
+                # while the report (LLM analysis + PDF render) is produced here on the request thread
+                restore_future = self._send_pool.submit(self._restore_contact_from_xano)
+                job_future = self._send_pool.submit(self._prefetch_job)
+                pdf_path, fit_score, profile_summary = self._generate_report_and_extract_data()
+                restore_future.result()
+                job_future.result()
+                if pdf_path:
+                    logger.info("Session conclude - PDF report generated: {}", pdf_path)
+                logger.info("Session conclude - Fit score extracted: {:.2f}", fit_score)
 
             # Identify missing fields
-            missing = []
-            if not self.session_state.application or not self.session_state.application.full_name:
-                missing.append("full_name")
-            if not self.session_state.application or not self.session_state.application.email:
-                missing.append("email")
-            if not self.session_state.application or not self.session_state.application.phone_number:
-                missing.append("phone")
+            missing = self._missing_contact_fields()
 
             # If some contact fields are missing, attempt to fetch them from conversation memory
             if missing:
-                logger.info(f"Missing contact fields at conclude: {missing}")
+                logger.info("Missing contact fields at conclude: {}", missing)
                 fetched = False
                 try:
                     fetched = self._fetch_contact_info_from_memory()
                     if fetched:
                         logger.info("Fetched missing contact info from conversation memory")
                 except Exception as e:
-                    logger.debug(f"Error scanning conversation memory: {e}")
+                    logger.debug("Error scanning conversation memory: {}", e)
 
-                # If still missing and we have an agent instance, prompt it to re-check history / ask user
-                if not fetched and self.agent:
+                # If still missing and we have an agent instance, prompt it to re-check history / ask user.
+                # That is a full LLM turn, so only pay for it when the history could plausibly help.
+                if not fetched and self.agent and self._history_may_hold_contact(missing):
                     try:
                         prompt = (
                             "Please re-check the conversation history and extract any candidate contact information "
@@ -535,78 +848,98 @@ class AgentToolkit:
                         if fetched:
                             logger.info("Fetched missing contact info after prompting agent")
                     except Exception as e:
-                        logger.debug(f"Failed to prompt agent for contact info: {e}")
+                        logger.debug("Failed to prompt agent for contact info: {}", e)
 
             # Only create candidate if one doesn't already exist
             if not candidate_id:
                 # Finally, attempt to create candidate if all required fields are present
-                if (
-                    self.session_state.application
-                    and not self._candidate_created
-                    and self.session_state.application.full_name
-                    and self.session_state.application.email
-                    and self.session_state.application.phone_number
-                ):
+                if self._can_create_candidate():
                     # Additional validation before creating candidate
-                    name = self.session_state.application.full_name
-                    email = self.session_state.application.email
+                    app = self.session_state.application
+                    name = app.full_name
+                    email = app.email
                     
                     # Validate name completeness (should have at least first and last name)
                     name_parts = name.split() if name else []
                     if len(name_parts) < 2:
-                        logger.warning(f"Name appears incomplete: '{name}' (only {len(name_parts)} part(s)). Agent should collect full name.")
+                        logger.warning("Name appears incomplete: '{}' (only {} part(s)). Agent should collect full name.", name, len(name_parts))
                     
                     # Validate email format
-                    email_pattern = r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}$"
-                    if not re.match(email_pattern, email):
-                        logger.warning(f"Email format invalid: '{email}'. Agent should validate email during conversation.")
+                    if not normalize_email(email):
+                        logger.warning("Email format invalid: '{}'. Agent should validate email during conversation.", email)
                     
-                    candidate_id = self._create_candidate_on_conclude(fit_score, profile_summary, pdf_path)
+                    # The session link is written by the single session update in Step 4
+                    candidate_id = self._create_candidate_on_conclude(fit_score, profile_summary, pdf_path, link_session=False)
                     if candidate_id:
-                        logger.info(f"Session conclude - Candidate created: {candidate_id}")
+                        logger.info("Session conclude - Candidate created: {}", candidate_id)
                 else:
                     logger.warning("Candidate will not be created on conclude: missing name, email, or phone")
             
             # Step 3: Transition to COMPLETED stage
-            from chatbot.state.states import ConversationStage
-            self.session_state.current_stage = ConversationStage.COMPLETED
-            
-            # Mark all stages as completed
-            if self.session_state.engagement:
-                self.session_state.engagement.stage_completed = True
-            if self.session_state.qualification:
-                self.session_state.qualification.stage_completed = True
-            if self.session_state.application:
-                self.session_state.application.stage_completed = True
-            if self.session_state.verification:
-                self.session_state.verification.stage_completed = True
+            self._mark_stages_completed()
             
-            logger.info(f"Transitioned to COMPLETED stage and marked all stages as completed")
-            
-            # Step 4: Update session in Xano
-            if xano_session_id:
-                update_data = {
-                    "Status": final_status,
-                    "conversation_stage": "completed",
-                    "conclusion_reason": reason,
-                }
-                
-                if candidate_id:
-                    update_data["candidate_id"] = candidate_id
-                
-                self.xano_client.update_session(xano_session_id, update_data)
-                logger.info(f"Session {xano_session_id} concluded with status: {final_status}, reason: {reason}")
+            # Step 4: Update session in Xano (one write carrying candidate link, conclusion and final state)
+            update_data = {
+                "Status": final_status,
+                "conversation_stage": "completed",
+                "conclusion_reason": reason,
+            }
+            if candidate_id:
+                update_data["candidate_id"] = candidate_id
             
-            # Sync final state to Xano if agent is available
             if self.agent:
-                self.agent.sync_session_state_to_xano()
+                # Sync final state to Xano, folding the conclusion fields into the same request
+                self.agent.sync_session_state_to_xano(extra_fields=update_data)
+            elif xano_session_id:
+                self.xano_client.update_session(xano_session_id, update_data)
+            if xano_session_id:
+                logger.info("Session {} concluded with status: {}, reason: {}", xano_session_id, final_status, reason)
             
             return f"Session concluded successfully. Status: {final_status}. Reason: {reason}"
             
         except Exception as e:
-            logger.error(f"Error concluding session: {e}")
+            logger.error("Error concluding session: {}", e)
             return f"Session ended with note: {reason}"
-    
+
+    def _restore_contact_from_xano(self) -> None:
+        """Fill contact fields missing locally from the Xano session (in case they were synced earlier)"""
+        xano_session_id = self.session_state.engagement.xano_session_id if self.session_state.engagement else None
+        if not xano_session_id:
+            return
+        try:
+            xano_session = self.xano_client.get_session_by_id(xano_session_id)
+            if xano_session:
+                # Load contact info from Xano into application state if not already present
+                app = self._ensure_application_state()
+                
+                # Restore from Xano if local state is missing
+                for attr, xano_key in self._XANO_CONTACT_FIELDS:
+                    if not getattr(app, attr) and xano_session.get(xano_key):
+                        setattr(app, attr, xano_session[xano_key])
+                        logger.info("Restored {} from Xano: {}", attr, xano_session[xano_key])
+        except Exception as e:
+            logger.debug("Could not load session data from Xano: {}", e)
+
+    def _mark_stages_completed(self) -> None:
+        """Move the session to COMPLETED and mark every stage present as completed"""
+        self.session_state.current_stage = ConversationStage.COMPLETED
+        for stage_state in (
+            self.session_state.engagement,
+            self.session_state.qualification,
+            self.session_state.application,
+            self.session_state.verification,
+        ):
+            if stage_state:
+                stage_state.stage_completed = True
+        logger.info("Transitioned to COMPLETED stage and marked all stages as completed")
+
+    def _known_candidate_id(self) -> Optional[int]:
+        """Candidate ID already created for this session, without creating one"""
+        if not self._candidate_id and self.session_state.engagement and self.session_state.engagement.candidate_id:
+            logger.info("Candidate already exists: {}", self.session_state.engagement.candidate_id)
+            self._candidate_id = self.session_state.engagement.candidate_id
+        return self._candidate_id
+
     def _ensure_candidate_created(self) -> Optional[int]:
         """
         Ensure candidate is created for this session before verification.
@@ -615,10 +948,10 @@ class AgentToolkit:
         Returns:
             Candidate ID if created or already exists, None if creation failed
         """
-        # Check if candidate already exists for this session
-        if self.session_state.engagement and self.session_state.engagement.candidate_id:
-            logger.info(f"Candidate already exists: {self.session_state.engagement.candidate_id}")
-            return self.session_state.engagement.candidate_id
+        # Candidate ID never changes once created, so answer from the memo when possible
+        candidate_id = self._known_candidate_id()
+        if candidate_id:
+            return candidate_id
         
         # Check if experience has been collected before allowing candidate creation
         if self.session_state.application and not self.session_state.application.experience_collected:
@@ -630,21 +963,18 @@ class AgentToolkit:
         logger.info("Candidate not yet created. Creating candidate now before verification...")
         
         try:
-            if (
-                self.session_state.application
-                and not self._candidate_created
-                and self.session_state.application.full_name
-                and self.session_state.application.email
-                and self.session_state.application.phone_number
-            ):
-                # Generate report and extract fit score and profile summary
+            if self._can_create_candidate():
+                # Warm the job lookup that candidate creation needs on the send pool while
+                # the report renders here, then join before creating
+                job_future = self._send_pool.submit(self._prefetch_job)
                 pdf_path, fit_score, profile_summary = self._generate_report_and_extract_data()
+                job_future.result()
                 
                 # Create candidate
                 candidate_id = self._create_candidate_on_conclude(fit_score, profile_summary, pdf_path)
                 
                 if candidate_id:
-                    logger.info(f"Candidate created successfully: {candidate_id}")
+                    logger.info("Candidate created successfully: {}", candidate_id)
                     return candidate_id
                 else:
                     logger.warning("Failed to create candidate")
@@ -654,9 +984,139 @@ class AgentToolkit:
                 return None
                 
         except Exception as e:
-            logger.error(f"Error ensuring candidate creation: {e}")
+            logger.error("Error ensuring candidate creation: {}", e)
             return None
     
+    def _post(self, url: str, payload: dict) -> Optional[dict]:
+        """POST a JSON payload to a Xano endpoint and return the decoded response, or None if it isn't a JSON object"""
+        response = self._session.post(url, data=_json_dumps(payload), headers=JSON_HEADERS, timeout=self.xano_client.timeout)
+        response.raise_for_status()
+        try:
+            result = _json_loads(response.content)
+        except ValueError as e:
+            logger.error("Invalid Xano response from {}: {}", url, e)
+            return None
+        if not isinstance(result, dict):
+            logger.error("Invalid Xano response from {}: expected a JSON object, got {}", url, type(result).__name__)
+            return None
+        return result
+
+    def _ensure_application_state(self) -> ApplicationState:
+        """Get the session's ApplicationState, creating it on first use"""
+        if not self.session_state.application:
+            self.session_state.application = ApplicationState(session_id=self.session_state.session_id)
+        return self.session_state.application
+
+    def _ensure_verification_state(self) -> VerificationState:
+        """Get the session's VerificationState, creating it on first use"""
+        if not self.session_state.verification:
+            self.session_state.verification = VerificationState(session_id=self.session_state.session_id)
+        return self.session_state.verification
+
+    def _is_recently_validated(self, key: Tuple[str, Optional[int], str]) -> bool:
+        """Check whether this (kind, user_id, code) was validated within the TTL and the contact is still verified"""
+        validated_at = self._validation_cache.get(key)
+        if validated_at is None or time.monotonic() - validated_at >= self.VALIDATION_CACHE_TTL:
+            return False
+        verification = self.session_state.verification
+        return bool(verification and getattr(verification, f"{key[0]}_verified"))
+
+    def _forget_validations(self, kind: str) -> None:
+        """Drop cached successes for one kind ("email" or "phone") once that contact changes"""
+        for key in [key for key in self._validation_cache if key[0] == kind]:
+            del self._validation_cache[key]
+
+    def _phone_code_sent(self) -> bool:
+        """True once a phone code went out (e.g. via send_both_verification_codes) or the phone is verified"""
+        verification = self.session_state.verification
+        return bool(verification and (verification.phone_verified or verification.phone_for_verification))
+
+    @staticmethod
+    def _send_code_key(kind: str, identifier: str) -> Tuple[str, str]:
+        """Rate-limit key, normalized so case, spacing or phone formatting can't dodge the limit"""
+        identifier = str(identifier).strip()
+        if kind == "email":
+            return kind, normalize_email(identifier) or identifier.lower()
+        return kind, normalize_phone(identifier) or identifier
+
+    def _send_code_wait(self, kind: str, identifier: str) -> int:
+        """Seconds until another code may be sent to this identifier (0 if allowed now)"""
+        sent = self._send_code_log.get(self._send_code_key(kind, identifier))
+        if not sent or len(sent) < self.SEND_CODE_LIMIT:
+            return 0
+        remaining = self.SEND_CODE_WINDOW - (time.monotonic() - sent[0])
+        return int(remaining) + 1 if remaining > 0 else 0
+
+    def _record_code_sent(self, kind: str, identifier: str) -> None:
+        """Remember a successful send for the rate limit (only the last SEND_CODE_LIMIT are kept)"""
+        key = self._send_code_key(kind, identifier)
+        if key not in self._send_code_log:
+            self._send_code_log[key] = deque(maxlen=self.SEND_CODE_LIMIT)
+        self._send_code_log[key].append(time.monotonic())
+
+    def _local_code_verdict(self, kind: str, code: str) -> Optional[dict]:
+        """
+        Check a code against the one Xano returned when it was sent.
+        
+        Only used when settings.VERIFICATION_LOCAL_CODE_CHECK is enabled. On a match this
+        returns the verdict Xano would have sent, so the validate call can be skipped;
+        otherwise None, and Xano stays the authority.
+        """
+        if not settings.VERIFICATION_LOCAL_CODE_CHECK or not self.session_state.verification:
+            return None
+        stored = getattr(self.session_state.verification, f"{kind}_verification_code")
+        if stored is None or not hmac.compare_digest(str(stored).strip().encode(), str(code).strip().encode()):
+            return None
+        logger.info("{} code matched the code stored at send time, skipping Xano validation", kind.capitalize())
+        return {"EmailVerification": True} if kind == "email" else {"Phone_Verification": True}
+
+    def _prepare_email_code_request(self, email: str):
+        """
+        Ensure the candidate exists and build the Send_Code_to_Email request.
+        
+        Returns:
+            Error message string, or (url, payload, candidate_id, user_id)
+        """
+        wait = self._send_code_wait("email", email)
+        if wait:
+            logger.warning("Email verification code limit reached for {}, retry in {}s", email, wait)
+            return f"✗ Too many verification codes requested for {email}. Please wait {wait} seconds before trying again."
+        
+        # Ensure candidate is created before verification
+        candidate_id = self._ensure_candidate_created()
+        if not candidate_id:
+            logger.warning("Cannot send email verification code: candidate could not be created")
+            return "✗ Unable to prepare verification. Please complete your application first."
+        
+        # Check if we already have user_id from candidate creation
+        user_id = None
+        if self.session_state.engagement and self.session_state.engagement.user_id:
+            user_id = self.session_state.engagement.user_id
+            logger.info("Using stored user_id {} from candidate creation", user_id)
+        
+        # Call Xano API to send email code
+        return SEND_EMAIL_CODE_URL, {"email": email}, candidate_id, user_id
+
+    def _on_email_code_sent(self, email: str, result: dict, candidate_id: int, user_id: Optional[int]) -> str:
+        """Store the email verification details returned by Xano"""
+        # Use user_id from API response if we don't have one yet
+        if not user_id:
+            user_id = result.get('id')
+        email_code = result.get('EmailCode')
+        
+        # Store verification state for this session
+        verification = self._ensure_verification_state()
+        self.session_state.current_stage = ConversationStage.VERIFICATION
+        verification.email_verification_user_id = user_id
+        verification.email_verification_code = email_code
+        verification.email_for_verification = email
+        verification.verification_status = "pending"
+        self._record_code_sent("email", email)
+        
+        logger.info("Email verification code sent to {}, user_id: {}, candidate_id: {} (verification pending)", email, user_id, candidate_id)
+        return f"✓ Verification code sent to {email}. Please check your email and enter the code when ready."
+
+    @_timed
     def send_email_verification_code(self, email: str) -> str:
         """
         Send email verification code to the candidate.
@@ -669,53 +1129,64 @@ class AgentToolkit:
             Message indicating success or failure, and stores user_id and code for later validation
         """
         try:
-            # Ensure candidate is created before verification
-            candidate_id = self._ensure_candidate_created()
-            if not candidate_id:
-                logger.warning("Cannot send email verification code: candidate could not be created")
-                return "✗ Unable to prepare verification. Please complete your application first."
-            
-            # Check if we already have user_id from candidate creation
-            user_id = None
-            if self.session_state.engagement and self.session_state.engagement.user_id:
-                user_id = self.session_state.engagement.user_id
-                logger.info(f"Using stored user_id {user_id} from candidate creation")
-            
-            # Call Xano API to send email code
-            url = "https://xoho-w3ng-km3o.n7e.xano.io/api:QMW9Va2W/Send_Code_to_Email"
-            payload = {"email": email}
-            
-            response = requests.post(url, json=payload, timeout=self.xano_client.timeout)
-            response.raise_for_status()
-            
-            result = response.json()
-            # Use user_id from API response if we don't have one yet
-            if not user_id:
-                user_id = result.get('id')
-            email_code = result.get('EmailCode')
-            
-            # Store verification state for this session
-            if not self.session_state.verification:
-                from chatbot.state.states import VerificationState
-                self.session_state.verification = VerificationState(session_id=self.session_state.session_id)
-            
-            self.session_state.current_stage = ConversationStage.VERIFICATION
-            self.session_state.verification.email_verification_user_id = user_id
-            self.session_state.verification.email_verification_code = email_code
-            self.session_state.verification.email_for_verification = email
-            self.session_state.verification.verification_status = "pending"
-            
-            logger.info(f"Email verification code sent to {email}, user_id: {user_id}, candidate_id: {candidate_id}")
-            logger.info(f"VerificationState updated: email_verification_user_id={user_id}, verification_status=pending")
-            return f"✓ Verification code sent to {email}. Please check your email and enter the code when ready."
+            request = self._prepare_email_code_request(email)
+            if isinstance(request, str):
+                return request
+            url, payload, candidate_id, user_id = request
+            result = self._post(url, payload)
+            if result is None:
+                return "✗ An error occurred while sending verification code. Please try again."
+            return self._on_email_code_sent(email, result, candidate_id, user_id)
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error sending email verification code: {e}")
+            logger.error("Error sending email verification code: {}", e)
             return f"✗ Failed to send verification code to {email}. Please try again."
-        except Exception as e:
-            logger.error(f"Unexpected error sending email verification code: {e}")
-            return f"✗ An error occurred while sending verification code. Please try again."
+        except Exception:
+            logger.exception("Unexpected error sending email verification code")
+            return "✗ An error occurred while sending verification code. Please try again."
+
+    def _prepare_email_validation_request(self, code: str):
+        """
+        Build the ValidateEmail request for the session's candidate.
+        
+        Returns:
+            Error message string, or (url, payload, candidate_id, user_id)
+        """
+        # Sending the code created the candidate, so there is nothing to validate without one
+        candidate_id = self._known_candidate_id()
+        if not candidate_id:
+            logger.warning("Cannot validate email verification code: no candidate for this session")
+            return "✗ Unable to complete verification. Please complete your application first."
+        
+        user_id = self.session_state.engagement.user_id
+        if self._is_recently_validated(("email", user_id, code)):
+            logger.info("Email code already validated for user_id: {}, skipping Xano call", user_id)
+            return "✓ Email verified successfully!"
+        logger.info("Validating email verification for user_id: {}, candidate_id: {}", user_id, candidate_id)
+        # Call Xano API to validate email code
+        return VALIDATE_EMAIL_URL, {"user_id": user_id, "Code": code}, candidate_id, user_id
+
+    def _on_email_validated(self, result: dict, code: str, candidate_id: int, user_id: Optional[int]) -> bool:
+        """Record the ValidateEmail verdict; returns True if the email is verified"""
+        logger.debug("Email verification response: {}", result)
+        email_verified = result.get('EmailVerification', False)
+        
+        if email_verified:
+            # Update verification state
+            verification = self._ensure_verification_state()
+            self.session_state.current_stage = ConversationStage.VERIFICATION
+            verification.email_verified = True
+            verification.verification_status = "verified"
+            verification.timestamp_verified = get_current_timestamp()
+            self._validation_cache[("email", user_id, code)] = time.monotonic()
+            logger.info("Email verified successfully for user_id: {}, candidate_id: {}", user_id, candidate_id)
+            return True
+        else:
+            logger.warning("Email verification failed for user_id: {}", user_id)
+            self._ensure_verification_state().verification_status = "failed"
+            return False
 
+    @_timed
     def validate_email_verification(self, user_id: int, code: str) -> str:
         """
         Validate email verification code provided by user.
@@ -729,56 +1200,81 @@ class AgentToolkit:
             Message indicating if verification was successful
         """
         try:
-            # Ensure candidate is created before validation
-            candidate_id = self._ensure_candidate_created()
-            if not candidate_id:
-                logger.warning("Cannot validate email verification code: candidate could not be created")
-                return "✗ Unable to complete verification. Please complete your application first."
-            
-            user_id = self.session_state.engagement.user_id
-            logger.info(f"Validating email verification for user_id: {user_id}, candidate_id: {candidate_id}")
-            # Call Xano API to validate email code
-            url = "https://xoho-w3ng-km3o.n7e.xano.io/api:QMW9Va2W/ValidateEmail"
-            payload = {"user_id": user_id, "Code": code}
-            
-            response = requests.post(url, json=payload, timeout=self.xano_client.timeout)
-            response.raise_for_status()
-            
-            result = response.json()
-            logger.info("========================================")
-            logger.info(f"Email verification response: {result}")
-
-            logger.info("========================================")
-            email_verified = result.get('EmailVerification', False)
-            
-            if email_verified:
-                # Update verification state
-                if not self.session_state.verification:
-                    from chatbot.state.states import VerificationState
-                    self.session_state.verification = VerificationState(session_id=self.session_state.session_id)
-                
-                
-                self.session_state.current_stage = ConversationStage.VERIFICATION
-                self.session_state.verification.email_verified = True
-                self.session_state.verification.verification_status = "verified"
-                from chatbot.utils.utils import get_current_timestamp
-                self.session_state.verification.timestamp_verified = get_current_timestamp()
-                logger.info(f"Email verified successfully for user_id: {user_id}, candidate_id: {candidate_id}")
-                logger.info(f"VerificationState updated: email_verified=True, verification_status=verified")
-                self.send_phone_verification_code(phone=self.session_state.application.phone_number)
+            request = self._prepare_email_validation_request(code)
+            if isinstance(request, str):
+                return request
+            url, payload, candidate_id, user_id = request
+            result = self._local_code_verdict("email", code) or self._post(url, payload)
+            if result is None:
+                return "✗ An error occurred during verification. Please try again."
+            
+            if self._on_email_validated(result, code, candidate_id, user_id):
+                if not self._phone_code_sent():
+                    self.send_phone_verification_code(phone=self.session_state.application.phone_number)
                 return "✓ Email verified successfully!"
-            else:
-                logger.warning(f"Email verification failed for user_id: {user_id}")
-                self.session_state.verification.verification_status = "failed"
-                return "✗ Email verification failed. Please check the code and try again."
+            return "✗ Email verification failed. Please check the code and try again."
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error validating email verification code: {e}")
-            return f"✗ Verification failed. Please try again."
-        except Exception as e:
-            logger.error(f"Unexpected error validating email verification: {e}")
-            return f"✗ An error occurred during verification. Please try again."
+            logger.error("Error validating email verification code: {}", e)
+            return "✗ Verification failed. Please try again."
+        except Exception:
+            logger.exception("Unexpected error validating email verification")
+            return "✗ An error occurred during verification. Please try again."
+
+    def _prepare_phone_code_request(self, phone: str):
+        """
+        Ensure the candidate exists and build the Send_Code_to_Phone request.
+        
+        Returns:
+            Error message string, or (url, payload, candidate_id, user_id)
+        """
+        wait = self._send_code_wait("phone", phone)
+        if wait:
+            logger.warning("Phone verification code limit reached for {}, retry in {}s", phone, wait)
+            return f"✗ Too many verification codes requested for {phone}. Please wait {wait} seconds before trying again."
+        
+        # Ensure candidate is created before verification
+        candidate_id = self._ensure_candidate_created()
+        if not candidate_id:
+            logger.warning("Cannot send phone verification code: candidate could not be created")
+            return "✗ Unable to prepare verification. Please complete your application first."
+        
+        # Check if we already have user_id from candidate creation
+        user_id = None
+        if self.session_state.engagement and self.session_state.engagement.user_id:
+            user_id = self.session_state.engagement.user_id
+            logger.info("Using stored user_id {} from candidate creation", user_id)
+        
+        # Call Xano API to send phone code (using email as identifier)
+        # The API expects email parameter based on the notebook example
+        email = self.session_state.application.email if self.session_state.application else None
+        if not email:
+            return "✗ Email not found in session. Please provide email first."
+        
+        return SEND_PHONE_CODE_URL, {"email": email}, candidate_id, user_id
 
+    def _on_phone_code_sent(self, phone: str, result: dict, candidate_id: int, user_id: Optional[int]) -> str:
+        """Store the phone verification details returned by Xano"""
+        # Use user_id from API response if we don't have one yet
+        if not user_id:
+            user_id = result.get('id')
+        phone_code = result.get('PhoneCode')
+        
+        # Store verification state for this session
+        verification = self._ensure_verification_state()
+        self.session_state.current_stage = ConversationStage.VERIFICATION
+        verification.phone_verification_user_id = user_id
+        verification.phone_verification_code = phone_code
+        verification.phone_for_verification = phone
+        self._record_code_sent("phone", phone)
+        # Keep existing email verification status if present
+        if not verification.email_verified:
+            verification.verification_status = "pending"
+        
+        logger.info("Phone verification code sent, user_id: {}, candidate_id: {}", user_id, candidate_id)
+        return f"✓ Verification code sent to {phone}. Please enter the code when ready."
+
+    @_timed
     def send_phone_verification_code(self, phone: str) -> str:
         """
         Send phone verification code to the candidate.
@@ -791,61 +1287,69 @@ class AgentToolkit:
             Message indicating success or failure, and stores user_id and code for later validation
         """
         try:
-            # Ensure candidate is created before verification
-            candidate_id = self._ensure_candidate_created()
-            if not candidate_id:
-                logger.warning("Cannot send phone verification code: candidate could not be created")
-                return "✗ Unable to prepare verification. Please complete your application first."
-            
-            # Check if we already have user_id from candidate creation
-            user_id = None
-            if self.session_state.engagement and self.session_state.engagement.user_id:
-                user_id = self.session_state.engagement.user_id
-                logger.info(f"Using stored user_id {user_id} from candidate creation")
-            
-            # Call Xano API to send phone code (using email as identifier)
-            url = "https://xoho-w3ng-km3o.n7e.xano.io/api:QMW9Va2W/Send_Code_to_Phone"
-            # The API expects email parameter based on the notebook example
-            if self.session_state.application and self.session_state.application.email:
-                email = self.session_state.application.email
-            else:
-                return "✗ Email not found in session. Please provide email first."
-            
-            payload = {"email": email}
-            
-            response = requests.post(url, json=payload, timeout=self.xano_client.timeout)
-            response.raise_for_status()
-            
-            result = response.json()
-            # Use user_id from API response if we don't have one yet
-            if not user_id:
-                user_id = result.get('id')
-            phone_code = result.get('PhoneCode')
-            
-            # Store verification state for this session
-            if not self.session_state.verification:
-                from chatbot.state.states import VerificationState
-                self.session_state.verification = VerificationState(session_id=self.session_state.session_id)
-            
-            self.session_state.current_stage = ConversationStage.VERIFICATION
-            self.session_state.verification.phone_verification_user_id = user_id
-            self.session_state.verification.phone_verification_code = phone_code
-            self.session_state.verification.phone_for_verification = phone
-            # Keep existing email verification status if present
-            if not self.session_state.verification.email_verified:
-                self.session_state.verification.verification_status = "pending"
-            
-            logger.info(f"Phone verification code sent, user_id: {user_id}, candidate_id: {candidate_id}")
-            logger.info(f"VerificationState updated: phone_verification_user_id={user_id}")
-            return f"✓ Verification code sent to {phone}. Please enter the code when ready."
+            request = self._prepare_phone_code_request(phone)
+            if isinstance(request, str):
+                return request
+            url, payload, candidate_id, user_id = request
+            result = self._post(url, payload)
+            if result is None:
+                return "✗ An error occurred while sending verification code. Please try again."
+            return self._on_phone_code_sent(phone, result, candidate_id, user_id)
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error sending phone verification code: {e}")
+            logger.error("Error sending phone verification code: {}", e)
             return f"✗ Failed to send verification code to {phone}. Please try again."
-        except Exception as e:
-            logger.error(f"Unexpected error sending phone verification code: {e}")
-            return f"✗ An error occurred while sending verification code. Please try again."
+        except Exception:
+            logger.exception("Unexpected error sending phone verification code")
+            return "✗ An error occurred while sending verification code. Please try again."
+
+    def _prepare_phone_validation_request(self, code: str):
+        """
+        Build the ValidatePhoneVerification request for the session's candidate.
+        
+        Returns:
+            Error message string, or (url, payload, candidate_id, user_id)
+        """
+        # Sending the code created the candidate, so there is nothing to validate without one
+        candidate_id = self._known_candidate_id()
+        if not candidate_id:
+            logger.warning("Cannot validate phone verification code: no candidate for this session")
+            return "✗ Unable to complete verification. Please complete your application first."
+        
+        user_id = self.session_state.engagement.user_id
+        if self._is_recently_validated(("phone", user_id, code)):
+            logger.info("Phone code already validated for user_id: {}, skipping Xano call", user_id)
+            return "✓ Phone verified successfully!"
+        
+        # Call Xano API to validate phone code
+        return VALIDATE_PHONE_URL, {"user_id": user_id, "Code": code}, candidate_id, user_id
+
+    def _on_phone_validated(self, result: dict, code: str, candidate_id: int, user_id: Optional[int]) -> str:
+        """Record the ValidatePhoneVerification verdict"""
+        phone_verified = result.get('Phone_Verification', False)
+        
+        if phone_verified:
+            # Update verification state
+            verification = self._ensure_verification_state()
+            self.session_state.current_stage = ConversationStage.COMPLETED
+            verification.phone_verified = True
+            self._validation_cache[("phone", user_id, code)] = time.monotonic()
+            
+            # Check if both email and phone are verified to complete verification stage
+            if verification.email_verified and verification.phone_verified:
+                verification.stage_completed = True
+                verification.verification_status = "verified"
+                if not verification.timestamp_verified:
+                    verification.timestamp_verified = get_current_timestamp()
+                logger.info("VERIFICATION stage completed: both email and phone verified")
+            
+            logger.info("Phone verified successfully for user_id: {}, candidate_id: {}", user_id, candidate_id)
+            return "✓ Phone verified successfully!"
+        else:
+            logger.warning("Phone verification failed for user_id: {}", user_id)
+            return "✗ Phone verification failed. Please check the code and try again."
 
+    @_timed
     def validate_phone_verification(self, user_id: int, code: str) -> str:
         """
         Validate phone verification code provided by user.
@@ -859,55 +1363,44 @@ class AgentToolkit:
             Message indicating if verification was successful
         """
         try:
-            # Ensure candidate is created before validation
-            candidate_id = self._ensure_candidate_created()
-            if not candidate_id:
-                logger.warning("Cannot validate phone verification code: candidate could not be created")
-                return "✗ Unable to complete verification. Please complete your application first."
-            
-            user_id = self.session_state.engagement.user_id
-            
-            # Call Xano API to validate phone code
-            url = "https://xoho-w3ng-km3o.n7e.xano.io/api:QMW9Va2W/ValidatePhoneVerification"
-            payload = {"user_id": user_id, "Code": code}
-            
-            response = requests.post(url, json=payload, timeout=self.xano_client.timeout)
-            response.raise_for_status()
-            
-            result = response.json()
-            phone_verified = result.get('Phone_Verification', False)
-            
-            if phone_verified:
-                # Update verification state
-                if not self.session_state.verification:
-                    from chatbot.state.states import VerificationState
-                    self.session_state.verification = VerificationState(session_id=self.session_state.session_id)
-                
-                self.session_state.current_stage = ConversationStage.COMPLETED
-                self.session_state.verification.phone_verified = True
-                
-                # Check if both email and phone are verified to complete verification stage
-                if self.session_state.verification.email_verified and self.session_state.verification.phone_verified:
-                    self.session_state.verification.stage_completed = True
-                    self.session_state.verification.verification_status = "verified"
-                    from chatbot.utils.utils import get_current_timestamp
-                    if not self.session_state.verification.timestamp_verified:
-                        self.session_state.verification.timestamp_verified = get_current_timestamp()
-                    logger.info(f"VERIFICATION stage completed: both email and phone verified")
-                
-                logger.info(f"Phone verified successfully for user_id: {user_id}, candidate_id: {candidate_id}")
-                logger.info(f"VerificationState updated: phone_verified=True")
-                return "✓ Phone verified successfully!"
-            else:
-                logger.warning(f"Phone verification failed for user_id: {user_id}")
-                return "✗ Phone verification failed. Please check the code and try again."
+            request = self._prepare_phone_validation_request(code)
+            if isinstance(request, str):
+                return request
+            url, payload, candidate_id, user_id = request
+            result = self._local_code_verdict("phone", code) or self._post(url, payload)
+            if result is None:
+                return "✗ An error occurred during verification. Please try again."
+            return self._on_phone_validated(result, code, candidate_id, user_id)
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error validating phone verification code: {e}")
-            return f"✗ Verification failed. Please try again."
-        except Exception as e:
-            logger.error(f"Unexpected error validating phone verification: {e}")
-            return f"✗ An error occurred during verification. Please try again."
+            logger.error("Error validating phone verification code: {}", e)
+            return "✗ Verification failed. Please try again."
+        except Exception:
+            logger.exception("Unexpected error validating phone verification")
+            return "✗ An error occurred during verification. Please try again."
+
+    @_timed
+    def send_both_verification_codes(self, email: str, phone: str) -> str:
+        """
+        Send both the email and the phone verification codes.
+        
+        Args:
+            email: Email address to send verification code to
+            phone: Phone number to send verification code to
+            
+        Returns:
+            Combined result message for both codes
+        """
+        # Create the candidate and verification state up front so the concurrent sends don't race to create them
+        if not self._ensure_candidate_created():
+            logger.warning("Cannot send verification codes: candidate could not be created")
+            return "✗ Unable to prepare verification. Please complete your application first."
+        self._ensure_verification_state()
+
+        # Send the phone code on the pool while the email code goes out on this thread
+        phone_future = self._send_pool.submit(self.send_phone_verification_code, phone)
+        email_result = self.send_email_verification_code(email)
+        return f"{email_result}\n{phone_future.result()}"
 
     def save_phone_number(self, phone_number: str) -> str:
         """
@@ -920,25 +1413,22 @@ class AgentToolkit:
             Success message confirming the phone number was saved
         """
         try:
-            from chatbot.state.states import ApplicationState
-            
-            # Ensure application state exists
-            if not self.session_state.application:
-                self.session_state.application = ApplicationState(session_id=self.session_state.session_id)
+            self._ensure_application_state()
             
             # Save phone number
             self.session_state.current_stage = ConversationStage.VERIFICATION
             self.session_state.application.phone_number = phone_number.strip()
-            logger.info(f"Phone number saved: {phone_number}")
+            self._bump_state_version()
+            logger.info("Phone number saved: {}", phone_number)
             
-            # Persist to Xano immediately
-            self._sync_application_data_to_xano()
+            # Persist to Xano in the background
+            self._schedule_contact_sync()
             
             return f"✓ Phone number saved: {phone_number}"
             
         except Exception as e:
-            logger.error(f"Error saving phone number: {e}")
-            return f"✗ Failed to save phone number. Please try again."
+            logger.error("Error saving phone number: {}", e)
+            return "✗ Failed to save phone number. Please try again."
 
     def save_email(self, email: str) -> str:
         """
@@ -951,25 +1441,22 @@ class AgentToolkit:
             Success message confirming the email was saved
         """
         try:
-            from chatbot.state.states import ApplicationState
-            
-            # Ensure application state exists
-            if not self.session_state.application:
-                self.session_state.application = ApplicationState(session_id=self.session_state.session_id)
+            self._ensure_application_state()
             
             # Save email (lowercase for consistency)
             self.session_state.current_stage = ConversationStage.APPLICATION
             self.session_state.application.email = email.strip().lower()
-            logger.info(f"Email saved: {email}")
+            self._bump_state_version()
+            logger.info("Email saved: {}", email)
             
-            # Persist to Xano immediately
-            self._sync_application_data_to_xano()
+            # Persist to Xano in the background
+            self._schedule_contact_sync()
             
             return f"✓ Email saved: {email}"
             
         except Exception as e:
-            logger.error(f"Error saving email: {e}")
-            return f"✗ Failed to save email. Please try again."
+            logger.error("Error saving email: {}", e)
+            return "✗ Failed to save email. Please try again."
 
     def save_name(self, full_name: str) -> str:
         """
@@ -982,24 +1469,21 @@ class AgentToolkit:
             Success message confirming the name was saved
         """
         try:
-            from chatbot.state.states import ApplicationState, ConversationStage
-            
-            # Ensure application state exists
-            if not self.session_state.application:
-                self.session_state.application = ApplicationState(session_id=self.session_state.session_id)
+            self._ensure_application_state()
             
             # Save name with proper capitalization
-            self.session_state.application.full_name = full_name.strip().title()
-            logger.info(f"Name saved: {full_name}")
+            self.session_state.application.full_name = NAME_PART_RE.sub(_capitalize_name_part, full_name.strip())
+            self._bump_state_version()
+            logger.info("Name saved: {}", full_name)
             
-            # Persist to Xano immediately
-            self._sync_application_data_to_xano()
+            # Persist to Xano in the background
+            self._schedule_contact_sync()
             
             return f"✓ Name saved: {full_name}"
             
         except Exception as e:
-            logger.error(f"Error saving name: {e}")
-            return f"✗ Failed to save name. Please try again."
+            logger.error("Error saving name: {}", e)
+            return "✗ Failed to save name. Please try again."
 
     def save_age(self, age: int) -> str:
         """
@@ -1012,27 +1496,24 @@ class AgentToolkit:
             Success message confirming the age was saved
         """
         try:
-            from chatbot.state.states import ApplicationState, QualificationState
-            
-            # Ensure application state exists
-            if not self.session_state.application:
-                self.session_state.application = ApplicationState(session_id=self.session_state.session_id)
+            self._ensure_application_state()
             
             # Save age
             self.session_state.application.age = age
-            logger.info(f"Age saved: {age}")
+            self._bump_state_version()
+            logger.info("Age saved: {}", age)
             
             # Update qualification state to mark age as confirmed
             if not self.session_state.qualification:
                 self.session_state.qualification = QualificationState(session_id=self.session_state.session_id)
             self.session_state.qualification.age_confirmed = True
-            logger.info(f"Qualification state updated: age_confirmed=True")
+            logger.info("Qualification state updated: age_confirmed=True")
             
             return f"✓ Age saved: {age}"
             
         except Exception as e:
-            logger.error(f"Error saving age: {e}")
-            return f"✗ Failed to save age. Please try again."
+            logger.error("Error saving age: {}", e)
+            return "✗ Failed to save age. Please try again."
 
     def mark_experience_collected(self) -> str:
         """
@@ -1044,22 +1525,20 @@ class AgentToolkit:
             Success message confirming experience collection is marked
         """
         try:
-            from chatbot.state.states import ApplicationState
-            
-            # Ensure application state exists
-            if not self.session_state.application:
-                self.session_state.application = ApplicationState(session_id=self.session_state.session_id)
+            self._ensure_application_state()
             
             # Mark experience as collected
             self.session_state.application.experience_collected = True
+            self._bump_state_version()
             logger.info("Experience/education/skills collection marked as complete")
             
             return "✓ Experience information collected and recorded"
             
         except Exception as e:
-            logger.error(f"Error marking experience collected: {e}")
+            logger.error("Error marking experience collected: {}", e)
             return "✗ Failed to mark experience collection. Please try again."
     
+    @_timed
     def create_candidate_early(self) -> str:
         """
         Create candidate record immediately with basic information (name, email, phone, age).
@@ -1082,19 +1561,13 @@ class AgentToolkit:
                 return "✗ Cannot create candidate: No application data available"
             
             app = self.session_state.application
-            if not app.full_name or not app.email or not app.phone_number:
-                missing = []
-                if not app.full_name:
-                    missing.append("name")
-                if not app.email:
-                    missing.append("email")
-                if not app.phone_number:
-                    missing.append("phone")
+            missing = self._missing_contact_fields()
+            if missing:
                 return f"✗ Cannot create candidate: Missing {', '.join(missing)}"
             
             # Validate email format
-            email_pattern = r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}$"
-            if not re.match(email_pattern, app.email.strip()):
+            email_clean = normalize_email(app.email)
+            if not email_clean:
                 return f"✗ Invalid email format: {app.email}"
             
             # Get job_id and company_id
@@ -1110,15 +1583,15 @@ class AgentToolkit:
             
             # Validate and fetch job_id if needed
             if job_id and not self._is_valid_uuid(job_id):
-                logger.warning(f"job_id '{job_id}' is not a valid UUID. Attempting to fetch from Xano...")
+                logger.warning("job_id '{}' is not a valid UUID. Attempting to fetch from Xano...", job_id)
                 job_data = self.xano_client.get_job_by_id(job_id)
                 if job_data and 'id' in job_data:
                     job_id = str(job_data['id'])
-                    logger.info(f"Retrieved UUID job_id from Xano: {job_id}")
+                    logger.info("Retrieved UUID job_id from Xano: {}", job_id)
                     if not company_id and 'company_id' in job_data:
                         company_id = job_data['company_id']
                 else:
-                    logger.error(f"Failed to retrieve valid job_id")
+                    logger.error("Failed to retrieve valid job_id")
                     job_id = None
             
             # Fetch company_id if missing
@@ -1126,29 +1599,17 @@ class AgentToolkit:
                 job_data = self.xano_client.get_job_by_id(job_id)
                 if job_data and '_related_company' in job_data:
                     company_id = job_data['_related_company']['id']
-                    logger.info(f"Retrieved company_id from job data: {company_id}")
+                    logger.info("Retrieved company_id from job data: {}", company_id)
             
             # Sanitize phone number (preserve + sign if present)
-            phone_clean = None
-            if app.phone_number:
-                try:
-                    stripped = str(app.phone_number).strip()
-                    # Check if phone starts with +
-                    has_plus = stripped.startswith('+')
-                    # Extract only digits
-                    digits = ''.join(filter(str.isdigit, stripped))
-                    if digits:
-                        # Add + sign back if it was present
-                        phone_clean = f"+{digits}" if has_plus else digits
-                except Exception:
-                    phone_clean = None
-            
-            logger.info(f"Creating candidate early: {app.full_name}")
+            phone_clean = normalize_phone(app.phone_number)
+            
+            logger.info("Creating candidate early: {}", app.full_name)
             
             # Create candidate WITHOUT report (score=0, no file_path)
             candidate = self.xano_client.create_candidate(
                 name=app.full_name,
-                email=app.email.strip().lower(),
+                email=email_clean,
                 phone=phone_clean,
                 score=0,  # No score yet
                 file_path=None,  # No report yet
@@ -1163,8 +1624,8 @@ class AgentToolkit:
                 candidate_id = candidate.get('id')
                 user_id = candidate.get('user_id')
                 self._candidate_created = True
+                self._candidate_id = candidate_id
                 
-                from chatbot.state.states import ConversationStage
                 self.session_state.current_stage = ConversationStage.APPLICATION
                 
                 # Store in engagement state
@@ -1172,7 +1633,7 @@ class AgentToolkit:
                     self.session_state.engagement.candidate_id = candidate_id
                     if user_id:
                         self.session_state.engagement.user_id = user_id
-                        logger.info(f"Saved user_id {user_id} for candidate {candidate_id}")
+                        logger.info("Saved user_id {} for candidate {}", user_id, candidate_id)
                     
                     # Update session with candidate_id
                     if xano_session_id:
@@ -1191,21 +1652,21 @@ class AgentToolkit:
                 if self.agent:
                     self.agent.sync_session_state_to_xano()
                 
-                logger.info(f"Created candidate {candidate_id} early without report")
+                logger.info("Created candidate {} early without report", candidate_id)
                 return f"✓ Candidate created successfully with ID: {candidate_id}"
             else:
                 return "✗ Failed to create candidate in system"
                 
         except Exception as e:
-            logger.error(f"Error creating candidate early: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error creating candidate early")
             return f"✗ Error creating candidate: {str(e)}"
 
+    @_timed
     def patch_candidate_with_report(self) -> str:
         """
         Generate report and patch the existing candidate with complete information.
         This is called at the end of the conversation to update the candidate with their report.
+        The patch and PDF upload run on the report pool, so this returns once the report is ready.
         
         Returns:
             Success message or error message
@@ -1217,49 +1678,28 @@ class AgentToolkit:
             
             candidate_id = self.session_state.engagement.candidate_id
             
+            # A patch still in flight would share this report's PDF; let it finish first
+            if self._report_patch_pending():
+                logger.info("Waiting for the pending report patch of candidate {}", candidate_id)
+                wait([self._report_task])
+            
             # Generate report
             pdf_path, fit_score, profile_summary = self._generate_report_and_extract_data()
             
             if not pdf_path:
                 logger.warning("No PDF report generated, patching with score and summary only")
             
-            # Get session info
-            xano_session_id = None
-            if self.session_state.engagement:
-                xano_session_id = self.session_state.engagement.xano_session_id
-            
-            # Ensure profile_summary is a string (should already be JSON string from report generator)
-            profile_summary_str = profile_summary if isinstance(profile_summary, str) else str(profile_summary)
-            
-            # Patch candidate with complete data (PDF upload handled internally)
-            result = self.xano_client.patch_candidate_complete(
-                candidate_id=candidate_id,
-                score=fit_score,
-                report_pdf=pdf_path,
-                status="Short Listed",
-                profile_summary=profile_summary_str,
-                session_id=xano_session_id
+            # Patch candidate with complete data in the background; the PDF upload is the slow part
+            self._report_task = self._report_pool.submit(
+                self._patch_candidate_report, candidate_id, pdf_path, fit_score, profile_summary
             )
-            if pdf_path and os.path.exists(pdf_path):
-                try:
-                    os.remove(pdf_path)
-                    logger.info(f"Deleted local PDF report: {pdf_path}")
-                except Exception as e:
-                    logger.warning(f"Failed to delete local PDF: {e}")
-                    return f"Failed to delete local PDF: {e}"
-                
-            if result:
-                logger.info(f"Successfully patched candidate {candidate_id} with report (score: {fit_score})")
-                return f"✓ Candidate report generated and updated (Fit Score: {fit_score:.0f}%)"
-            else:
-                return "✗ Failed to update candidate with report"
+            return f"✓ Candidate report generated (Fit Score: {fit_score:.0f}%). The candidate record is being updated."
                 
         except Exception as e:
-            logger.error(f"Error patching candidate with report: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error patching candidate with report")
             return f"✗ Error updating candidate: {str(e)}"
 
+    @_timed
     def update_candidate_email(self, new_email: str) -> str:
         """
         Update the candidate's email address.
@@ -1273,14 +1713,15 @@ class AgentToolkit:
         """
         try:
             # Validate email format
-            email_pattern = r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}$"
-            if not re.match(email_pattern, new_email.strip()):
+            email_clean = normalize_email(new_email)
+            if not email_clean:
                 return f"✗ Invalid email format: {new_email}"
             
             # Update in application state
             if self.session_state.application:
-                self.session_state.application.email = new_email.strip().lower()
-                logger.info(f"Updated email in application state: {new_email}")
+                self.session_state.application.email = email_clean
+                self._bump_state_version()
+                logger.info("Updated email in application state: {}", new_email)
             
             # If candidate already created, patch in Xano
             if self.session_state.engagement and self.session_state.engagement.candidate_id:
@@ -1288,15 +1729,16 @@ class AgentToolkit:
                 
                 result = self.xano_client.patch_candidate_email(
                     candidate_id=candidate_id,
-                    email=new_email.strip().lower()
+                    email=email_clean
                 )
                 
                 if result:
-                    logger.info(f"Updated candidate {candidate_id} email to: {new_email}")
+                    logger.info("Updated candidate {} email to: {}", candidate_id, new_email)
                     # Reset email verification since email changed
                     if self.session_state.verification:
                         self.session_state.verification.email_verified = False
                         self.session_state.verification.email_for_verification = None
+                    self._forget_validations("email")
                     return f"✓ Email updated to: {new_email}. Please verify the new email."
                 else:
                     return "✗ Failed to update email in system"
@@ -1305,9 +1747,10 @@ class AgentToolkit:
                 return f"✓ Email updated to: {new_email}"
                 
         except Exception as e:
-            logger.error(f"Error updating candidate email: {e}")
+            logger.error("Error updating candidate email: {}", e)
             return f"✗ Error updating email: {str(e)}"
 
+    @_timed
     def update_candidate_phone(self, new_phone: str) -> str:
         """
         Update the candidate's phone number.
@@ -1321,25 +1764,15 @@ class AgentToolkit:
         """
         try:
             # Clean phone number (preserve + sign if present, extract digits)
-            phone_clean = None
-            try:
-                stripped = new_phone.strip()
-                # Check if phone starts with +
-                has_plus = stripped.startswith('+')
-                # Extract only digits
-                digits = ''.join(filter(str.isdigit, str(stripped)))
-                if digits:
-                    # Add + sign back if it was present
-                    phone_clean = f"+{digits}" if has_plus else digits
-                else:
-                    return f"✗ Invalid phone number format: {new_phone}"
-            except Exception:
+            phone_clean = normalize_phone(new_phone)
+            if not phone_clean:
                 return f"✗ Invalid phone number format: {new_phone}"
             
             # Update in application state
             if self.session_state.application:
                 self.session_state.application.phone_number = phone_clean
-                logger.info(f"Updated phone in application state: {phone_clean}")
+                self._bump_state_version()
+                logger.info("Updated phone in application state: {}", phone_clean)
             
             # If candidate already created, patch in Xano
             if self.session_state.engagement and self.session_state.engagement.candidate_id:
@@ -1351,11 +1784,12 @@ class AgentToolkit:
                 )
                 
                 if result:
-                    logger.info(f"Updated candidate {candidate_id} phone to: {new_phone}")
+                    logger.info("Updated candidate {} phone to: {}", candidate_id, new_phone)
                     # Reset phone verification since phone changed
                     if self.session_state.verification:
                         self.session_state.verification.phone_verified = False
                         self.session_state.verification.phone_for_verification = None
+                    self._forget_validations("phone")
                     return f"✓ Phone number updated to: {new_phone}. Please verify the new phone number."
                 else:
                     return "✗ Failed to update phone number in system"
@@ -1364,23 +1798,58 @@ class AgentToolkit:
                 return f"✓ Phone number updated to: {new_phone}"
                 
         except Exception as e:
-            logger.error(f"Error updating candidate phone: {e}")
+            logger.error("Error updating candidate phone: {}", e)
             return f"✗ Error updating phone: {str(e)}"
 
-    def get_tools(self) -> List[StructuredTool]:
+    def get_tools(self, stage: Optional[ConversationStage] = None) -> List[StructuredTool]:
         """
-        Get all tools bound to this toolkit's session state.
+        Get the tools bound to this toolkit's session state.
+        The tools are built on first call and reused afterwards.
+        
+        Args:
+            stage: Only return the tools in this stage's TOOL_PROFILES entry (None for all tools)
         
         Returns:
             List of StructuredTool instances bound to this toolkit
         """
-        tools = [
-            StructuredTool.from_function(
+        if self._tools is None:
+            self._tools = self._build_tools()
+        if stage is None:
+            return self._tools
+        
+        stage_key = getattr(stage, "value", stage)
+        if stage_key not in self._stage_tools:
+            names = TOOL_PROFILES.get(stage_key)
+            self._stage_tools[stage_key] = self._tools if names is None else [t for t in self._tools if t.name in names]
+        return self._stage_tools[stage_key]
+
+    def _make_tool(self, func, name: str, description: str) -> StructuredTool:
+        """
+        Wrap a toolkit method as a StructuredTool, reusing its argument schema.
+        
+        The schema depends only on the method signature, so it is inferred the first
+        time any toolkit builds the tool and shared by every later session.
+        """
+        args_schema = self._args_schemas.get(name)
+        tool = StructuredTool.from_function(
+            func=func,
+            name=name,
+            description=description,
+            args_schema=args_schema,
+        )
+        if args_schema is None:
+            self._args_schemas[name] = tool.args_schema
+        return tool
+
+    def _build_tools(self) -> List[StructuredTool]:
+        """Wrap the toolkit methods as StructuredTools (called once per toolkit by get_tools)"""
+        return [
+            self._make_tool(
                 func=self.save_state,
                 name="save_state",
                 description="Save the current conversation state to persistent storage. Use this to save key conversation milestones like when user starts application, shares resume, or agrees to proceed.",
             ),
-            StructuredTool.from_function(
+            self._make_tool(
                 func=self.save_name,
                 name="save_name",
                 description=(
@@ -1390,7 +1859,7 @@ class AgentToolkit:
                     "Input: full_name (e.g., 'John Smith', 'Sarah Johnson')"
                 ),
             ),
-            StructuredTool.from_function(
+            self._make_tool(
                 func=self.save_email,
                 name="save_email",
                 description=(
@@ -1399,7 +1868,7 @@ class AgentToolkit:
                     "Input: email (e.g., 'john.doe@example.com')"
                 ),
             ),
-            StructuredTool.from_function(
+            self._make_tool(
                 func=self.save_phone_number,
                 name="save_phone_number",
                 description=(
@@ -1408,7 +1877,7 @@ class AgentToolkit:
                     "Input: phone_number (e.g., '555-123-4567', '+1-555-123-4567')"
                 ),
             ),
-            StructuredTool.from_function(
+            self._make_tool(
                 func=self.save_age,
                 name="save_age",
                 description=(
@@ -1417,7 +1886,7 @@ class AgentToolkit:
                     "Input: age (integer, e.g., 25, 30)"
                 ),
             ),
-            StructuredTool.from_function(
+            self._make_tool(
                 func=self.mark_experience_collected,
                 name="mark_experience_collected",
                 description=(
@@ -1436,7 +1905,7 @@ class AgentToolkit:
                     "NO INPUT REQUIRED - just call the tool when you've collected experience info."
                 ),
             ),
-            StructuredTool.from_function(
+            self._make_tool(
                 func=self.create_candidate_early,
                 name="create_candidate_early",
                 description=(
@@ -1447,7 +1916,7 @@ class AgentToolkit:
                     "Do NOT call this multiple times - check if candidate is already created first."
                 ),
             ),
-            StructuredTool.from_function(
+            self._make_tool(
                 func=self.update_candidate_email,
                 name="update_candidate_email",
                 description=(
@@ -1457,7 +1926,7 @@ class AgentToolkit:
                     "Input: new_email (the corrected email address)"
                 ),
             ),
-            StructuredTool.from_function(
+            self._make_tool(
                 func=self.update_candidate_phone,
                 name="update_candidate_phone",
                 description=(
@@ -1467,7 +1936,7 @@ class AgentToolkit:
                     "Input: new_phone (the corrected phone number)"
                 ),
             ),
-            StructuredTool.from_function(
+            self._make_tool(
                 func=self.send_email_verification_code,
                 name="send_email_verification_code",
                 description=(
@@ -1485,7 +1954,7 @@ class AgentToolkit:
                     "Input: candidate's email address."
                 ),
             ),
-            StructuredTool.from_function(
+            self._make_tool(
                 func=self.validate_email_verification,
                 name="validate_email_verification",
                 description=(
@@ -1497,7 +1966,7 @@ class AgentToolkit:
                     "Input: user_id (from email send response) and the 6-digit code user provided."
                 ),
             ),
-            StructuredTool.from_function(
+            self._make_tool(
                 func=self.send_phone_verification_code,
                 name="send_phone_verification_code",
                 description=(
@@ -1517,7 +1986,7 @@ class AgentToolkit:
                     "Input: candidate's phone number."
                 ),
             ),
-            StructuredTool.from_function(
+            self._make_tool(
                 func=self.validate_phone_verification,
                 name="validate_phone_verification",
                 description=(
@@ -1530,7 +1999,18 @@ class AgentToolkit:
                     "Input: user_id (from phone send response) and the 6-digit code user provided."
                 ),
             ),
-            StructuredTool.from_function(
+            self._make_tool(
+                func=self.send_both_verification_codes,
+                name="send_both_verification_codes",
+                description=(
+                    "Send the email AND phone verification codes to the candidate in one step. "
+                    "CRITICAL: Execute this tool COMPLETELY SILENTLY, exactly like send_email_verification_code. "
+                    "Use this instead of the two separate send tools when the candidate is ready to verify both their email and phone. "
+                    "After the tool returns, tell the user which codes were sent and ask for them. "
+                    "Input: candidate's email address and phone number."
+                ),
+            ),
+            self._make_tool(
                 func=self.patch_candidate_with_report,
                 name="patch_candidate_with_report",
                 description=(
@@ -1540,7 +2020,7 @@ class AgentToolkit:
                     "Typically called just before concluding the session."
                 ),
             ),
-            StructuredTool.from_function(
+            self._make_tool(
                 func=self.conclude_session,
                 name="conclude_session",
                 description=(
@@ -1550,7 +2030,6 @@ class AgentToolkit:
                 ),
             ),
         ]
-        return tools
 
 
 def create_agent_tools(session_state: "SessionState", job_id: Optional[str] = None, agent: Optional["CleoRAGAgent"] = None) -> List[StructuredTool]:
@@ -166,7 +166,7 @@ ALWAYS ask at least THREE follow-up questions (experience OR skills if no experi
 CRITICAL INVISIBLE STEPS:
 - After name+email+phone+age + experience → create_candidate_early (silent)
 - After experience questions → mark_experience_collected (if available)
-- Verification: send_*_code (silent) → wait for code → validate_*_verification (silent)
+- Verification: send_both_verification_codes once email AND phone are saved (silent; otherwise send_*_code) → wait for codes → validate_*_verification (silent)
 - End: patch_candidate_with_report (silent) + conclude_session (silent)
 
 Never announce profile creation, tool usage, or internal steps.
@@ -192,6 +192,13 @@ SYSTEM_PROMPT = (
     MODULE_6_DETAILED_FLOW_AND_TOOLS
 )
 
+# SYSTEM_PROMPT with the stage already filled in, keyed by stage value; only the
+# session ID is left to substitute when an agent builds its prompt
+_STAGE_SYSTEM_PROMPTS: Dict[str, str] = {
+    stage.value: SYSTEM_PROMPT.format(session_id="{session_id}", current_stage=stage.value)
+    for stage in ConversationStage
+}
+
 
 def get_system_prompt(
     session_id: str,
@@ -211,10 +218,7 @@ def get_system_prompt(
         Complete system prompt with stage-specific instructions (English only)
     """
 
-    base_prompt = SYSTEM_PROMPT.format(
-        session_id=session_id, 
-        current_stage=current_stage.value
-    )
+    base_prompt = _STAGE_SYSTEM_PROMPTS[current_stage.value].replace("{session_id}", session_id, 1)
     
     # Add job context if available
     if job_context:
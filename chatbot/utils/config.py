@@ -41,6 +41,10 @@ class Settings(BaseSettings):
     # Report Configuration
     REPORT_FORMAT: str = "pdf"
     INCLUDE_FIT_SCORE_IN_REPORT: bool = False
+    # Agent Configuration
+    STAGE_TOOL_PROFILES: bool = False  # Only offer the tools in the current stage's TOOL_PROFILES entry
+    # Verification Configuration
+    VERIFICATION_LOCAL_CODE_CHECK: bool = False  # Accept codes matching the one Xano returned at send time without a validate call
     # Retrieval Configuration (Removed - using Xano API)
     # DEFAULT_RETRIEVAL_METHOD: str = "hybrid"
     # TOP_K_RESULTS: int = 5
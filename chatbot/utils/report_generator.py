@@ -27,7 +27,7 @@ class ReportGenerator:
     def __init__(self, xano_client=None):
         self.reports_dir = settings.REPORTS_DIR
         os.makedirs(self.reports_dir, exist_ok=True)
-        self.xano_client = XanoClient()
+        self.xano_client = xano_client or XanoClient()
 
     def generate_report(self, session_id: str) -> Dict[str, str]:
         """
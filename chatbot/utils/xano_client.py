@@ -2,9 +2,14 @@
 Xano API Client
 Handles all interactions with Xano backend APIs
 """
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+import copy
 import os
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from chatbot.utils.utils import setup_logging
 from dotenv import load_dotenv
 
@@ -19,6 +24,7 @@ XANO_CHAT_API_URL = "https://xoho-w3ng-km3o.n7e.xano.io/api:wnnakKFu"
 XANO_SESSION_API_URL = "https://xoho-w3ng-km3o.n7e.xano.io/api:mYiFh-E2"
 XANO_CANDIDATE_API_URL = "https://xoho-w3ng-km3o.n7e.xano.io/api:6skoiMBa"
 XANO_COMPANY_API_URL = "https://xoho-w3ng-km30.n7e.xano.io/api:JpRLUNqy"
+XANO_VERIFICATION_API_URL = "https://xoho-w3ng-km3o.n7e.xano.io/api:QMW9Va2W"
 
 # Default credentials
 DEFAULT_EMAIL = "user@example.com"
@@ -28,6 +34,10 @@ DEFAULT_PASSWORD = "string123"
 class XanoClient:
     """Client for interacting with Xano APIs"""
 
+    # Seconds a fetched job record is reused; every session for a posting asks for the same job
+    JOB_CACHE_TTL = 300
+    JOB_CACHE_MAX_ENTRIES = 256
+
     def __init__(self, timeout: int = 10, email: str = DEFAULT_EMAIL, password: str = DEFAULT_PASSWORD):
         """
         Initialize Xano API client and authenticate
@@ -39,8 +49,14 @@ class XanoClient:
         """
         self.timeout = timeout
         self.session = requests.Session()
+        # Keep-alive pool shared by every Xano call (all APIs live on the same host).
+        # Retry connection failures and gateway errors; urllib3 never re-sends a POST/PATCH after a response.
+        retry = Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        self.session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry))
         self.auth_token = None
         self.headers = {"Content-Type": "application/json"}
+        self._job_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}  # job_id -> (fetched at, job)
+        self._job_cache_lock = threading.Lock()
         
         # # Login to get auth token
         # self._login(email, password)
@@ -306,9 +322,35 @@ class XanoClient:
             logger.error(f"Unexpected error creating job: {e}")
             return None
 
+    def _cache_job(self, job_key: str, job: Dict[str, Any]) -> None:
+        """Remember a fetched job, dropping expired (then oldest) entries when the cache is full"""
+        now = time.monotonic()
+        with self._job_cache_lock:
+            self._job_cache.pop(job_key, None)
+            if len(self._job_cache) >= self.JOB_CACHE_MAX_ENTRIES:
+                for key in [k for k, (fetched_at, _) in self._job_cache.items() if now - fetched_at >= self.JOB_CACHE_TTL]:
+                    del self._job_cache[key]
+                while len(self._job_cache) >= self.JOB_CACHE_MAX_ENTRIES:
+                    del self._job_cache[next(iter(self._job_cache))]
+            self._job_cache[job_key] = (now, job)
+            # A legacy ID resolves to the job's UUID, which callers look up next; cache it under both
+            if job.get("id") is not None:
+                self._job_cache.setdefault(str(job["id"]), (now, job))
+
+    def _forget_job(self, job_id: str) -> None:
+        """Drop a job from the cache, including entries stored under its other ID"""
+        job_keys = {str(job_id)}
+        with self._job_cache_lock:
+            cached = self._job_cache.get(str(job_id))
+            if cached and cached[1].get("id") is not None:
+                job_keys.add(str(cached[1]["id"]))
+            for key in [k for k, (_, job) in self._job_cache.items() if k in job_keys or str(job.get("id")) in job_keys]:
+                del self._job_cache[key]
+
     def get_job_by_id(self, job_id: str) -> Optional[Dict[str, Any]]:
         """
-        Fetch a specific job by its ID from Xano
+        Fetch a specific job by its ID from Xano.
+        Successful lookups are reused for JOB_CACHE_TTL seconds; callers get their own copy.
         
         Args:
             job_id: The unique identifier for the job
@@ -316,6 +358,9 @@ class XanoClient:
         Returns:
             Job dictionary if found, None otherwise
         """
+        cached = self._job_cache.get(str(job_id))
+        if cached and time.monotonic() - cached[0] < self.JOB_CACHE_TTL:
+            return copy.deepcopy(cached[1])
         try:
             url = f"{XANO_JOB_API_URL}/job/{job_id}"
             logger.info(f"Fetching job from Xano: {job_id}")
@@ -323,7 +368,8 @@ class XanoClient:
             response.raise_for_status()
             job = response.json()
             logger.info(f"Successfully fetched job: {job.get('job_title', 'Unknown')} (ID: {job_id})")
-            return job
+            self._cache_job(str(job_id), job)
+            return copy.deepcopy(job)
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
                 logger.warning(f"Job not found with ID: {job_id}")
@@ -355,6 +401,7 @@ class XanoClient:
             response.raise_for_status()
             result = response.json()
             logger.info(f"Successfully updated job {job_id}")
+            self._forget_job(job_id)
             return result
         except requests.exceptions.RequestException as e:
             logger.error(f"Error updating job {job_id} in Xano: {e}")
@@ -379,6 +426,7 @@ class XanoClient:
             response = self.session.delete(url, headers=self.headers, timeout=self.timeout)
             response.raise_for_status()
             logger.info(f"Successfully deleted job {job_id}")
+            self._forget_job(job_id)
             return True
         except requests.exceptions.RequestException as e:
             logger.error(f"Error deleting job {job_id} from Xano: {e}")
@@ -669,14 +717,16 @@ class XanoClient:
             # Handle file upload if provided
             if file_path:
                 import mimetypes
-                if os.path.exists(file_path):
+                try:
+                    file_handle = open(file_path, 'rb')
+                except FileNotFoundError:
+                    logger.warning(f"File not found: {file_path}")
+                    files = None
+                else:
                     file_name = os.path.basename(file_path)
                     mime_type, _ = mimetypes.guess_type(file_path)
                     mime_type = mime_type or 'application/octet-stream'
-                    files = {'File': (file_name, open(file_path, 'rb'), mime_type)}
-                else:
-                    logger.warning(f"File not found: {file_path}")
-                    files = None
+                    files = {'File': (file_name, file_handle, mime_type)}
             else:
                 # If no file_path provided, don't include File field at all
                 files = None
@@ -794,7 +844,7 @@ class XanoClient:
             logger.info(f"Payload: {payload}")
             
             # Send PATCH request with JSON payload
-            response = requests.patch(
+            response = self.session.patch(
                 url, 
                 json=payload,
                 headers=headers,
@@ -805,8 +855,8 @@ class XanoClient:
             result = response.json()
             logger.info(f"Successfully patched candidate {candidate_id}")
             
-            # Upload PDF report separately if provided
-            if report_pdf and os.path.exists(report_pdf):
+            # Upload PDF report separately if provided (the upload reports a missing file itself)
+            if report_pdf:
                 logger.info(f"Uploading PDF report for candidate {candidate_id}")
                 upload_result = self.upload_candidate_report_pdf(
                     candidate_id=candidate_id,
@@ -845,7 +895,9 @@ class XanoClient:
         """
         file_handle = None
         try:
-            if not os.path.exists(report_pdf_path):
+            try:
+                file_handle = open(report_pdf_path, 'rb')
+            except FileNotFoundError:
                 logger.error(f"PDF file not found: {report_pdf_path}")
                 return None
             
@@ -857,8 +909,6 @@ class XanoClient:
             mime_type, _ = mimetypes.guess_type(report_pdf_path)
             mime_type = mime_type or 'application/pdf'
             
-            file_handle = open(report_pdf_path, 'rb')
-            
             # Prepare multipart form data
             files = {
                 'File': (file_name, file_handle, mime_type)
@@ -873,7 +923,7 @@ class XanoClient:
             logger.info(f"File: {file_name}")
             
             # Use PATCH method for update_file endpoint
-            response = requests.patch(
+            response = self.session.patch(
                 url,
                 files=files,
                 data=data,
@@ -934,7 +984,7 @@ class XanoClient:
             logger.info(f"URL: {url}")
             logger.info(f"Payload: {payload}")
             
-            response = requests.patch(
+            response = self.session.patch(
                 url, 
                 json=payload,
                 headers=headers,
@@ -301,7 +301,6 @@ def test_conclude_fetches_from_memory():
         def update_session(self, *args, **kwargs):
             return True
     toolkit.xano_client = DummyXanoClient()
-    toolkit._report_generator = toolkit._report_generator  # keep existing generator if any
 
     fit_score = FitScoreComponents(qualification_score=0.0, experience_score=0.0, personality_score=0.0, total_score=0.0, breakdown={})
     # Call conclude_session - it should read from memory and create candidate